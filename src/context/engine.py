@@ -5,11 +5,89 @@ Implements the ContextCurator class for managing context through static analysis
 This implements METHOD-0006 Context Curation Engine framework.
 """
 import ast
+import heapq
+import json
+import operator
 import os
+import sys
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from ..utils import _DATACLASS_SLOTS, _json_dumps
+
+# Task dependency types (METHOD-0006 Section 2.2) -> ContextIndex list
+# attribute and the set attribute mirroring it for duplicate checks
+_DEPENDENCY_ATTRS = {
+    'upstream': ('upstream_tasks', '_upstream_set'),
+    'downstream': ('downstream_tasks', '_downstream_set'),
+    'parallel': ('parallel_work', '_parallel_set')
+}
+
+
+def _make_dependency_adder(list_attr: str, set_attr: str):
+    """
+    Build a single-kind dependency adder for ContextIndex.
+    
+    Each adder is bound to one list/set pair when the module loads, so
+    adding a dependency needs no type comparison or attribute-name lookup.
+    """
+    get_list = operator.attrgetter(list_attr)
+    get_set = operator.attrgetter(set_attr)
+    
+    def add(ctx_index: 'ContextIndex', task_ref: str) -> None:
+        seen = get_set(ctx_index)
+        # Already recorded dependencies are not duplicated
+        if task_ref in seen:
+            return
+        # Task refs recur across contexts (one task's upstream is another's
+        # downstream), so intern them to share a single string per ID
+        if type(task_ref) is str:
+            task_ref = sys.intern(task_ref)
+        seen.add(task_ref)
+        get_list(ctx_index).append(task_ref)
+    
+    return add
+
+
+_DEPENDENCY_ADDERS = {
+    dependency_type: _make_dependency_adder(list_attr, set_attr)
+    for dependency_type, (list_attr, set_attr) in _DEPENDENCY_ATTRS.items()
+}
+
+# Propagation change types (METHOD-0006 Section 4.3) -> ContextIndex ref list
+_PROPAGATION_REFS = {
+    'decision': operator.attrgetter('decision_refs'),
+    'spec': operator.attrgetter('spec_refs'),
+    'file': operator.attrgetter('files')
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({
+            sys.intern(key) if isinstance(key, str) else key: _freeze(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert frozen mappings back to dicts and tuples to lists."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Leaf nodes that never contain names worth recording as dependencies
+_SKIP_DEPENDENCY_NODES = (ast.Constant, ast.expr_context)
 
 
 @dataclass
@@ -23,6 +101,19 @@ class CodeElement:
     signature: str = ""
     dependencies: Set[str] = field(default_factory=set)
     docstring: Optional[str] = None
+    
+    # Case-folded forms used for relevance scoring, cached per element
+    _name_folded: str = field(init=False, repr=False, compare=False)
+    _deps_folded: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._name_folded = self.name.casefold()
+    
+    def deps_folded(self) -> FrozenSet[str]:
+        """Return the case-folded dependency names (computed once)."""
+        if self._deps_folded is None:
+            self._deps_folded = frozenset(dep.casefold() for dep in self.dependencies)
+        return self._deps_folded
 
 
 @dataclass
@@ -42,7 +133,7 @@ class ContextItem:
             self.last_evaluated = datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ContextIndex:
     """
     Complete Context Index structure per METHOD-0006 Section 2.2.
@@ -82,6 +173,11 @@ class ContextIndex:
     downstream_tasks: List[str] = field(default_factory=list)
     parallel_work: List[str] = field(default_factory=list)
     
+    # Set mirrors of the dependency lists for O(1) duplicate checks
+    _upstream_set: Set[str] = field(init=False, repr=False, compare=False)
+    _downstream_set: Set[str] = field(init=False, repr=False, compare=False)
+    _parallel_set: Set[str] = field(init=False, repr=False, compare=False)
+    
     # Change History (Section 2.2)
     change_history: List[Dict] = field(default_factory=list)
     
@@ -92,6 +188,11 @@ class ContextIndex:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     last_evaluated: Optional[datetime] = None
+    
+    def __post_init__(self):
+        self._upstream_set = set(self.upstream_tasks)
+        self._downstream_set = set(self.downstream_tasks)
+        self._parallel_set = set(self.parallel_work)
 
 
 class DependencyGraph:
@@ -103,6 +204,9 @@ class DependencyGraph:
         """Initialize the dependency graph."""
         self.nodes: Dict[str, CodeElement] = {}
         self.edges: Dict[str, Set[str]] = {}  # node_id -> set of dependency node_ids
+        self._by_name: Dict[str, FrozenSet[str]] = {}  # element name -> node_ids
+        self._type_counts: Dict[str, int] = {}  # element type -> node count
+        self._files: Set[str] = set()  # file paths with at least one node
     
     def add_node(self, element: CodeElement) -> str:
         """
@@ -115,9 +219,16 @@ class DependencyGraph:
             Node ID
         """
         node_id = f"{element.file_path}::{element.name}"
+        previous = self.nodes.get(node_id)
+        if previous is not None:
+            self._type_counts[previous.type] -= 1
         self.nodes[node_id] = element
+        self._type_counts[element.type] = self._type_counts.get(element.type, 0) + 1
+        self._files.add(element.file_path)
         if node_id not in self.edges:
             self.edges[node_id] = set()
+        # Frozen so find_by_name can hand the index entry out directly
+        self._by_name[element.name] = self._by_name.get(element.name, frozenset()) | {node_id}
         return node_id
     
     def add_edge(self, from_id: str, to_id: str):
@@ -149,6 +260,18 @@ class DependencyGraph:
         
         return all_deps
     
+    def find_by_name(self, name: str) -> FrozenSet[str]:
+        """
+        Find the nodes whose element name is exactly ``name``.
+        
+        Args:
+            name: Element name to look up
+            
+        Returns:
+            Set of matching node IDs (empty if there are none)
+        """
+        return self._by_name.get(name, frozenset())
+    
     def find_related(self, target_name: str) -> List[str]:
         """
         Find all nodes related to a target name.
@@ -192,7 +315,16 @@ class ASTAnalyzer:
             tree = ast.parse(source, filename=file_path)
             elements = []
             
-            for node in ast.walk(tree):
+            # Breadth-first, like ast.walk, so elements keep the same order.
+            # Class and function definitions are statements, so expression
+            # subtrees never need to be visited to find them
+            queue = deque([tree])
+            while queue:
+                node = queue.popleft()
+                if isinstance(node, ast.expr):
+                    continue
+                queue.extend(ast.iter_child_nodes(node))
+                
                 if isinstance(node, ast.ClassDef):
                     element = self._extract_class(node, file_path, source)
                     elements.append(element)
@@ -223,7 +355,7 @@ class ASTAnalyzer:
         docstring = ast.get_docstring(node)
         
         return CodeElement(
-            name=node.name,
+            name=sys.intern(node.name),
             type='class',
             file_path=file_path,
             line_start=line_start,
@@ -249,7 +381,7 @@ class ASTAnalyzer:
         docstring = ast.get_docstring(node)
         
         return CodeElement(
-            name=node.name,
+            name=sys.intern(node.name),
             type='function',
             file_path=file_path,
             line_start=line_start,
@@ -263,15 +395,23 @@ class ASTAnalyzer:
         """Extract names referenced in an AST node."""
         dependencies = set()
         
-        for child in ast.walk(node):
+        stack = [node]
+        while stack:
+            child = stack.pop()
+            if isinstance(child, _SKIP_DEPENDENCY_NODES):
+                continue
+            stack.extend(ast.iter_child_nodes(child))
+            
+            # Identifiers recur heavily across elements; intern them so the
+            # dependency sets share string storage
             if isinstance(child, ast.Name):
-                dependencies.add(child.id)
+                dependencies.add(sys.intern(child.id))
             elif isinstance(child, ast.Import):
                 for alias in child.names:
-                    dependencies.add(alias.name)
+                    dependencies.add(sys.intern(alias.name))
             elif isinstance(child, ast.ImportFrom):
                 if child.module:
-                    dependencies.add(child.module)
+                    dependencies.add(sys.intern(child.module))
         
         return dependencies
     
@@ -315,31 +455,52 @@ class ContextCurator:
         self.ast_analyzer = ASTAnalyzer()
         self.dependency_graph = DependencyGraph()
         self.context_indexes: Dict[str, ContextIndex] = {}
-        self.living_docs: Dict[str, any] = {}
+        # Dense handle table for tight loops (see resolve_ctx)
+        self._ctx_list: List[ContextIndex] = []
+        self._ctx_id_to_idx: Dict[str, int] = {}
+        self._living_docs: Mapping[str, Any] = MappingProxyType({})
+        self._has_living_docs = False
         
         # Scan project on initialization
         self._scan_project()
     
+    @property
+    def living_docs(self) -> Mapping[str, Any]:
+        """Living Documentation as a frozen, read-only mapping."""
+        return self._living_docs
+    
+    @living_docs.setter
+    def living_docs(self, living_docs: Mapping[str, Any]):
+        # Plain dicts assigned directly are frozen like loaded data; the
+        # emptiness flag is kept in step so lookups never see a stale value
+        self._living_docs = _freeze(living_docs)
+        self._has_living_docs = bool(self._living_docs)
+    
     def _scan_project(self):
-        """Scan project and build dependency graph."""
-        python_files = list(self.project_root.rglob("*.py"))
+        """
+        Scan project and build dependency graph.
+        
+        Runs in two phases: all nodes are added first, then edges are built
+        through the graph's name index so forward references resolve
+        regardless of file traversal order.
+        """
+        graph = self.dependency_graph
+        node_ids = []
         
-        for file_path in python_files:
+        for file_path in self.project_root.rglob("*.py"):
             # Skip virtual environments and build directories
             if any(part in file_path.parts for part in ['venv', 'env', '__pycache__', '.git', 'build', 'dist']):
                 continue
             
-            elements = self.ast_analyzer.analyze_file(str(file_path))
-            
-            for element in elements:
-                node_id = self.dependency_graph.add_node(element)
-                
-                # Add dependency edges
-                for dep in element.dependencies:
-                    # Try to find the dependency in the graph
-                    matching_nodes = [nid for nid in self.dependency_graph.nodes.keys() if dep in nid]
-                    for match in matching_nodes:
-                        self.dependency_graph.add_edge(node_id, match)
+            for element in self.ast_analyzer.analyze_file(str(file_path)):
+                node_ids.append(graph.add_node(element))
+        
+        # Add dependency edges
+        find_by_name = graph.find_by_name
+        for node_id in node_ids:
+            for dep in graph.nodes[node_id].dependencies:
+                for match in find_by_name(dep):
+                    graph.add_edge(node_id, match)
     
     def find_related_code(self, target: str, max_depth: int = 2) -> List[CodeElement]:
         """
@@ -425,18 +586,13 @@ class ContextCurator:
         """
         ctx_id = f"CTX-{task_id}"
         
-        # Create Context Index with full METHOD-0006 Section 2.2 structure
-        ctx_index = ContextIndex(
-            ctx_id=ctx_id,
-            task_id=task_id,
-            objectives=objectives or [],
-            decision_refs=decision_refs or [],
-            spec_refs=spec_refs or []
-        )
-        
         # Find all related code for each focus area using static analysis
         related_files = set()
         context_items = []
+        # The same element is often reached from several focus areas; its
+        # score only depends on the element itself, so compute it once
+        relevance_cache: Dict[str, float] = {}
+        focus_folded = [focus.casefold() for focus in focus_areas]
         
         for focus in focus_areas:
             elements = self.find_related_code(focus)
@@ -444,29 +600,51 @@ class ContextCurator:
                 related_files.add(element.file_path)
                 
                 # Create ContextItem with relevance scoring (METHOD-0006 Section 3.3)
+                item_id = f"{element.file_path}::{element.name}"
+                relevance = relevance_cache.get(item_id)
+                if relevance is None:
+                    relevance = self._calculate_initial_relevance(element, focus_folded)
+                    relevance_cache[item_id] = relevance
+                
                 signature = self.extract_signature(element)
                 item = ContextItem(
-                    item_id=f"{element.file_path}::{element.name}",
+                    item_id=item_id,
                     item_type='code',
                     content=signature,
-                    relevance_score=self._calculate_initial_relevance(element, focus_areas),
+                    relevance_score=relevance,
                     source=f"static_analysis:{focus}"
                 )
                 context_items.append(item)
         
-        # Populate Affected Areas (METHOD-0006 Section 2.2)
-        ctx_index.files = list(related_files)
-        ctx_index.modules = list(set(str(Path(f).parent) for f in related_files))
-        
-        # Store context items with relevance scores
-        ctx_index.context_items = context_items
+        # Create Context Index with full METHOD-0006 Section 2.2 structure.
+        # Sections known up front are passed in directly so their lists are
+        # allocated once at final size rather than created empty and replaced;
+        # caller lists are copied so later updates don't mutate them.
+        ctx_index = ContextIndex(
+            ctx_id=ctx_id,
+            task_id=task_id,
+            objectives=list(objectives) if objectives else [],
+            # Affected Areas (METHOD-0006 Section 2.2)
+            files=list(related_files),
+            modules=list(set(str(Path(f).parent) for f in related_files)),
+            decision_refs=list(decision_refs) if decision_refs else [],
+            spec_refs=list(spec_refs) if spec_refs else [],
+            # Context items with relevance scores
+            context_items=context_items
+        )
         
-        # Store in context indexes
+        # Store in context indexes, replacing any previous index for the task
         self.context_indexes[ctx_id] = ctx_index
+        idx = self._ctx_id_to_idx.get(ctx_id)
+        if idx is None:
+            self._ctx_id_to_idx[sys.intern(ctx_id)] = len(self._ctx_list)
+            self._ctx_list.append(ctx_index)
+        else:
+            self._ctx_list[idx] = ctx_index
         
         return ctx_id
     
-    def _calculate_initial_relevance(self, element: CodeElement, focus_areas: List[str]) -> float:
+    def _calculate_initial_relevance(self, element: CodeElement, focus_folded: List[str]) -> float:
         """
         Calculate initial relevance score per METHOD-0006 Section 3.3.
         
@@ -479,27 +657,26 @@ class ContextCurator:
         
         Args:
             element: CodeElement to score
-            focus_areas: Focus areas for the task
+            focus_folded: Focus areas for the task, already case-folded
             
         Returns:
             Relevance score between 0.0 and 1.0
         """
-        element_name_lower = element.name.lower()
+        element_name = element._name_folded
         
         # Direct match: 1.0
-        for focus in focus_areas:
-            if element_name_lower == focus.lower():
-                return 1.0
+        if element_name in focus_folded:
+            return 1.0
         
         # Contains focus area: 0.8
-        for focus in focus_areas:
-            if focus.lower() in element_name_lower:
+        for focus in focus_folded:
+            if focus in element_name:
                 return 0.8
         
         # Related by dependency: 0.6
-        for focus in focus_areas:
-            if focus.lower() in ' '.join(element.dependencies).lower():
-                return 0.6
+        dependencies = element.deps_folded()
+        if any(focus in dependencies for focus in focus_folded):
+            return 0.6
         
         # Default: potentially relevant
         return 0.4
@@ -520,10 +697,10 @@ class ContextCurator:
         Returns:
             Dictionary with evaluation results
         """
-        if ctx_id not in self.context_indexes:
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is None:
             return {'error': 'Context index not found'}
         
-        ctx_index = self.context_indexes[ctx_id]
         ctx_index.last_evaluated = datetime.now(timezone.utc)
         
         results = {
@@ -592,7 +769,7 @@ class ContextCurator:
             keep = False
         
         # 4. Consistency: Check alignment with Living Docs if available
-        if self.living_docs:
+        if self._has_living_docs:
             # Basic consistency check: for decision/spec types, verify they're referenced
             if item.item_type in ['decision', 'spec']:
                 item_ref = item.item_id.split('::')[-1] if '::' in item.item_id else item.item_id
@@ -631,13 +808,13 @@ class ContextCurator:
         Returns:
             True if updated successfully
         """
-        if ctx_id not in self.context_indexes:
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is None:
             return False
         
         if not 0.0 <= new_score <= 1.0:
             return False
         
-        ctx_index = self.context_indexes[ctx_id]
         for item in ctx_index.context_items:
             if item.item_id == item_id:
                 item.relevance_score = new_score
@@ -646,6 +823,30 @@ class ContextCurator:
         
         return False
     
+    def get_top_context_items(self, ctx_id: str, k: int) -> List[ContextItem]:
+        """
+        Get the k most relevant context items per METHOD-0006 Section 3.3.
+        
+        Uses a bounded heap, so only k items are ever ordered rather than
+        sorting the whole context. Ties keep their original order.
+        
+        Args:
+            ctx_id: Context Index ID
+            k: Number of items to return
+            
+        Returns:
+            Context items ordered by descending relevance score
+        """
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is None or k <= 0:
+            return []
+        
+        return heapq.nlargest(
+            k,
+            ctx_index.context_items,
+            key=lambda item: item.relevance_score
+        )
+    
     def get_context(self, ctx_id: str) -> Optional[Dict]:
         """
         Retrieve a context index by ID.
@@ -659,24 +860,35 @@ class ContextCurator:
         Returns:
             Context index data or None
         """
-        if ctx_id not in self.context_indexes:
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is None:
             return None
         
-        ctx_index = self.context_indexes[ctx_id]
-        
-        # Extract focus areas from context items for backwards compatibility
-        focus_areas = list(set(
-            fa for fa in (
-                item.source.split(':')[1] if ':' in item.source else ''
-                for item in ctx_index.context_items
-                if item.source.startswith('static_analysis:')
-            ) if fa
-        ))
+        # Single pass over context items: collect focus areas (for backwards
+        # compatibility), serialized items and code signatures together
+        focus_areas = set()
+        context_items = []
+        signatures = []
+        prefix = 'static_analysis:'
+        prefix_len = len(prefix)
+        for item in ctx_index.context_items:
+            source = item.source
+            if source.startswith(prefix) and len(source) > prefix_len:
+                focus_areas.add(source[prefix_len:])
+            content = item.content
+            context_items.append({
+                'item_id': item.item_id,
+                'type': item.item_type,
+                'relevance_score': item.relevance_score,
+                'content': content[:200] + '...' if len(content) > 200 else content
+            })
+            if item.item_type == 'code':
+                signatures.append(content)
         
         return {
             'ctx_id': ctx_index.ctx_id,
             'task_id': ctx_index.task_id,
-            'focus_areas': focus_areas,  # For backwards compatibility
+            'focus_areas': list(focus_areas),  # For backwards compatibility
             # Task Scope
             'objectives': ctx_index.objectives,
             'constraints': ctx_index.constraints,
@@ -699,22 +911,48 @@ class ContextCurator:
             # Change History
             'change_history': ctx_index.change_history,
             # Context Items with scores
-            'context_items': [
-                {
-                    'item_id': item.item_id,
-                    'type': item.item_type,
-                    'relevance_score': item.relevance_score,
-                    'content': item.content[:200] + '...' if len(item.content) > 200 else item.content
-                }
-                for item in ctx_index.context_items
-            ],
-            'signatures': [item.content for item in ctx_index.context_items if item.item_type == 'code'],
+            'context_items': context_items,
+            'signatures': signatures,
             # Metadata
             'created_at': ctx_index.created_at.isoformat(),
             'last_updated': ctx_index.last_updated.isoformat(),
             'last_evaluated': ctx_index.last_evaluated.isoformat() if ctx_index.last_evaluated else None
         }
     
+    def get_context_json(self, ctx_id: str) -> Optional[bytes]:
+        """
+        Retrieve a context index serialized as UTF-8 JSON.
+        
+        Intended for callers that ship the Context Index over the wire;
+        uses orjson when it is installed and the standard library otherwise.
+        
+        Args:
+            ctx_id: Context index ID
+            
+        Returns:
+            JSON-encoded context index or None
+        """
+        context = self.get_context(ctx_id)
+        if context is None:
+            return None
+        
+        return _json_dumps(context)
+    
+    def get_last_updated(self, ctx_id: str) -> Optional[datetime]:
+        """
+        Get when a Context Index was last updated.
+        
+        Args:
+            ctx_id: Context Index ID
+            
+        Returns:
+            Last update time or None if the context index does not exist
+        """
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is None:
+            return None
+        return ctx_index.last_updated
+    
     def slice_code(self, file_path: str, 
                    element_names: List[str]) -> Dict[str, str]:
         """
@@ -745,11 +983,12 @@ class ContextCurator:
         Returns:
             Dictionary with counts of different element types
         """
+        graph = self.dependency_graph
         stats = {
-            'files_analyzed': len(set(node.file_path for node in self.dependency_graph.nodes.values())),
-            'classes': sum(1 for node in self.dependency_graph.nodes.values() if node.type == 'class'),
-            'functions': sum(1 for node in self.dependency_graph.nodes.values() if node.type == 'function'),
-            'total_elements': len(self.dependency_graph.nodes)
+            'files_analyzed': len(graph._files),
+            'classes': graph._type_counts.get('class', 0),
+            'functions': graph._type_counts.get('function', 0),
+            'total_elements': len(graph.nodes)
         }
         return stats
     
@@ -777,11 +1016,10 @@ class ContextCurator:
         Returns:
             True if update successful
         """
-        if ctx_id not in self.context_indexes:
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is None:
             return False
         
-        ctx_index = self.context_indexes[ctx_id]
-        
         # Add to change history (METHOD-0006 Section 2.2)
         change_entry = {
             'change_id': f"CTX-{datetime.now(timezone.utc).strftime('%Y%m%d')}-{len(ctx_index.change_history) + 1:02d}",
@@ -835,28 +1073,25 @@ class ContextCurator:
         """
         updated_contexts = []
         
-        for ctx_id, ctx_index in self.context_indexes.items():
-            should_update = False
-            
-            if change_type == 'decision' and changed_id in ctx_index.decision_refs:
-                should_update = True
-            elif change_type == 'spec' and changed_id in ctx_index.spec_refs:
-                should_update = True
-            elif change_type == 'file' and changed_id in ctx_index.files:
-                should_update = True
-            
-            if should_update:
+        # The ref lists are public and may be edited directly, so read them
+        # rather than a derived index; the handle table keeps creation order
+        get_refs = _PROPAGATION_REFS.get(change_type)
+        if get_refs is None:
+            return updated_contexts
+        
+        for ctx_index in self._ctx_list:
+            if changed_id in get_refs(ctx_index):
                 self.update_context_on_change(
-                    ctx_id,
+                    ctx_index.ctx_id,
                     change_type,
                     f"Propagated update from {changed_id}",
                     [changed_id]
                 )
-                updated_contexts.append(ctx_id)
+                updated_contexts.append(ctx_index.ctx_id)
         
         return updated_contexts
     
-    def load_living_documentation(self, living_docs_data: Dict) -> None:
+    def load_living_documentation(self, living_docs_data: Union[Dict, str, Path]) -> None:
         """
         Load Living Documentation per METHOD-0006 Section 5.
         
@@ -868,12 +1103,32 @@ class ContextCurator:
         - Task/Project Rules
         - Agent Instructions
         
+        The data is stored as a frozen copy (read-only mappings, lists as
+        tuples, interned keys) since it is read far more often than written;
+        use update_living_docs to change it.
+        
         Args:
-            living_docs_data: Dictionary containing living documentation
+            living_docs_data: Dictionary containing living documentation, or
+                path to a JSON file holding it (parsed once, straight into
+                the frozen form)
         """
+        if isinstance(living_docs_data, (str, os.PathLike)):
+            with open(living_docs_data, 'rb') as f:
+                living_docs_data = json.load(f)
         self.living_docs = living_docs_data
     
-    def get_living_docs_context(self, category: str) -> Optional[Dict]:
+    def update_living_docs(self, patch: Dict) -> None:
+        """
+        Replace or add Living Documentation categories.
+        
+        Args:
+            patch: Dictionary mapping categories to their new data
+        """
+        living_docs = dict(self._living_docs)
+        living_docs.update(_freeze(patch))
+        self.living_docs = living_docs
+    
+    def get_living_docs_context(self, category: str) -> Optional[Mapping]:
         """
         Retrieve Living Documentation context by category.
         
@@ -890,7 +1145,21 @@ class ContextCurator:
         Returns:
             Living docs data for category or None
         """
-        return self.living_docs.get(category)
+        if not self._has_living_docs:
+            return None
+        return self._living_docs.get(category)
+    
+    def export_living_docs(self) -> Dict[str, Any]:
+        """
+        Return Living Documentation as plain dicts and lists.
+        
+        The stored data is frozen; use this copy wherever it needs to be
+        serialized (e.g. json.dumps) or modified by the caller.
+        
+        Returns:
+            Independent copy of the Living Documentation
+        """
+        return _thaw(self._living_docs)
     
     def add_assumption(self, 
                       ctx_id: str, 
@@ -907,18 +1176,69 @@ class ContextCurator:
         Returns:
             True if added successfully
         """
-        if ctx_id not in self.context_indexes:
+        # Single exit keeps this hot path's code shape stable
+        added = False
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is not None:
+            if provisional:
+                ctx_index.provisional_assumptions.append(assumption)
+            else:
+                ctx_index.assumptions.append(assumption)
+            ctx_index.last_updated = datetime.now(timezone.utc)
+            added = True
+        return added
+    
+    def add_assumptions_bulk(self,
+                             ctx_id: str,
+                             assumptions: Iterable[str],
+                             provisional: bool = False) -> bool:
+        """
+        Add several assumptions to a Context Index in one update.
+        
+        Equivalent to calling add_assumption for each item, but looks up the
+        index and marks it updated once for the whole batch.
+        
+        Args:
+            ctx_id: Context Index ID
+            assumptions: Assumption texts
+            provisional: Whether these are provisional assumptions needing validation
+            
+        Returns:
+            True if added successfully
+        """
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is None:
             return False
         
-        ctx_index = self.context_indexes[ctx_id]
         if provisional:
-            ctx_index.provisional_assumptions.append(assumption)
+            ctx_index.provisional_assumptions.extend(assumptions)
         else:
-            ctx_index.assumptions.append(assumption)
+            ctx_index.assumptions.extend(assumptions)
         
         ctx_index.last_updated = datetime.now(timezone.utc)
         return True
     
+    def resolve_ctx(self, ctx_id: str) -> Optional[int]:
+        """
+        Resolve a Context Index ID to an integer handle.
+        
+        The handle stays valid for the lifetime of the curator (rebuilding
+        an index for the same task reuses it), so tight loops can resolve
+        once and then use the *_by_idx methods.
+        
+        Args:
+            ctx_id: Context Index ID
+            
+        Returns:
+            Integer handle, or None if the context index does not exist
+        """
+        return self._ctx_id_to_idx.get(ctx_id)
+    
+    def _get_ctx(self, ctx_id: str) -> Optional[ContextIndex]:
+        """Return the Context Index for ``ctx_id`` via resolve_ctx, or None."""
+        idx = self.resolve_ctx(ctx_id)
+        return None if idx is None else self._ctx_list[idx]
+    
     def add_dependency(self,
                       ctx_id: str,
                       dependency_type: str,
@@ -934,19 +1254,80 @@ class ContextCurator:
         Returns:
             True if added successfully
         """
-        if ctx_id not in self.context_indexes:
+        idx = self.resolve_ctx(ctx_id)
+        if idx is None:
             return False
+        return self.add_dependency_by_idx(idx, dependency_type, task_ref)
+    
+    def add_dependency_by_idx(self,
+                              idx: int,
+                              dependency_type: str,
+                              task_ref: str) -> bool:
+        """
+        Add a task dependency to the Context Index with the given handle.
+        
+        Args:
+            idx: Handle returned by resolve_ctx
+            dependency_type: 'upstream', 'downstream', or 'parallel'
+            task_ref: Task reference ID
+            
+        Returns:
+            True if added successfully
+        """
+        # Single exit keeps this hot path's code shape stable
+        added = False
+        add = _DEPENDENCY_ADDERS.get(dependency_type)
+        if add is not None and 0 <= idx < len(self._ctx_list):
+            ctx_index = self._ctx_list[idx]
+            add(ctx_index, task_ref)
+            ctx_index.last_updated = datetime.now(timezone.utc)
+            added = True
+        return added
+    
+    def add_dependencies_bulk(self,
+                              ctx_id: str,
+                              dependency_type: str,
+                              task_refs: Iterable[str]) -> bool:
+        """
+        Add several task dependencies of one type in one update.
         
-        ctx_index = self.context_indexes[ctx_id]
+        Equivalent to calling add_dependency for each item, but looks up the
+        index and marks it updated once for the whole batch.
         
-        if dependency_type == 'upstream':
-            ctx_index.upstream_tasks.append(task_ref)
-        elif dependency_type == 'downstream':
-            ctx_index.downstream_tasks.append(task_ref)
-        elif dependency_type == 'parallel':
-            ctx_index.parallel_work.append(task_ref)
-        else:
+        Args:
+            ctx_id: Context Index ID
+            dependency_type: 'upstream', 'downstream', or 'parallel'
+            task_refs: Task reference IDs
+            
+        Returns:
+            True if added successfully
+        """
+        ctx_index = self._get_ctx(ctx_id)
+        if ctx_index is None:
             return False
         
+        attrs = _DEPENDENCY_ATTRS.get(dependency_type)
+        if attrs is None:
+            return False
+        list_attr, set_attr = attrs
+        
+        # Homogeneous string batches are interned entirely in C; anything
+        # else (e.g. integer IDs) is stored as given
+        task_refs = list(task_refs)
+        try:
+            task_refs = list(map(sys.intern, task_refs))
+        except TypeError:
+            pass
+        
+        # Skip refs already recorded (or repeated within the batch); the
+        # bound methods are fetched once for the whole loop
+        seen = getattr(ctx_index, set_attr)
+        mark_seen = seen.add
+        append_ref = getattr(ctx_index, list_attr).append
+        for task_ref in task_refs:
+            if task_ref not in seen:
+                mark_seen(task_ref)
+                append_ref(task_ref)
+        
         ctx_index.last_updated = datetime.now(timezone.utc)
         return True
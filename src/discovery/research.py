@@ -10,10 +10,51 @@ automatic parsing and reformatting to EVD template format.
 import os
 import re
 import json
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from ..utils import TemplateManager
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from ..utils import _DATACLASS_SLOTS, _RecordMapping, TemplateManager
+
+
+# Extraction patterns used by UserEvidenceParser, compiled once at import
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+# Any recognised section header; the section body runs from the end of the
+# header up to the next line starting with '##' (or the end of the text)
+_SECTION_RE = re.compile(
+    r'##?\s*((?:Key )?(?:Findings?|Insights?|Conclusions?)|Summary|Overview|Abstract'
+    r'|Methodology|Method|Approach|Recommendations?|Takeaways?)\s*[:\n]+',
+    re.IGNORECASE
+)
+
+# Section kinds in the order each extractor prefers them
+_SUMMARY_SECTIONS = ('summary', 'overview', 'abstract')
+_METHOD_SECTIONS = ('methodology', 'method', 'approach')
+_CONCLUSION_SECTIONS = ('conclusion', 'recommendation', 'takeaway')
+
+# Bullet points and numbered lists; group 1 is set only for bullet points
+_BULLET_RE = re.compile(r'^\s*(?:([-*•])|\d+\.)\s+(.+)$', re.MULTILINE)
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+_EVD_NUM_RE = re.compile(r'EVD-(\d+)')
+
+# Artifact types that must reference harvested evidence
+_EVIDENCE_REQUIRED_ARTIFACTS = frozenset({'DEC', 'SPEC', 'REQ'})
+
+# Capped so a long run of URL-safe characters cannot become one huge source
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]{1,2048}')
+
+# Each citation pattern is paired with a literal that any match must contain,
+# so inputs without it can skip the regex entirely
+_CITATION_RES = [
+    ('](', re.compile(r'\[([^\]]+)\]\(([^)]+)\)', re.MULTILINE)),  # Markdown links
+    ('Source:', re.compile(r'Source:\s*(.+)', re.MULTILINE)),
+    ('Reference:', re.compile(r'Reference:\s*(.+)', re.MULTILINE)),
+]
 
 
 class UserEvidenceParser:
@@ -45,7 +86,8 @@ class UserEvidenceParser:
         """
         self.template_manager = template_manager or TemplateManager()
     
-    def parse_user_research(self, raw_input: str) -> Dict[str, Any]:
+    def parse_user_research(self, raw_input: str,
+                            now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Parse user-provided research from any format.
         
@@ -59,61 +101,103 @@ class UserEvidenceParser:
         
         Args:
             raw_input: User-provided research in any format
+            now: Timestamp to record as the parse date (default: current time)
             
         Returns:
             Dictionary with structured data
         """
-        if not raw_input or not raw_input.strip():
+        # Strip once; the title/summary fallbacks reuse the result
+        stripped = raw_input.strip() if raw_input else ''
+        if not stripped:
             raise ValueError("User research input cannot be empty")
         
+        # Locate every known section in a single pass over the input
+        sections = self._find_sections(raw_input)
+        
         parsed = {
-            'title': self._extract_title(raw_input),
-            'summary': self._extract_summary(raw_input),
-            'key_insights': self._extract_key_insights(raw_input),
+            'title': self._extract_title(raw_input, stripped),
+            'summary': self._extract_summary(raw_input, sections, stripped),
+            'key_insights': self._extract_key_insights(raw_input, sections),
             'sources': self._extract_sources(raw_input),
-            'methodology': self._extract_methodology(raw_input),
-            'conclusions': self._extract_conclusions(raw_input),
+            'methodology': self._extract_methodology(raw_input, sections),
+            'conclusions': self._extract_conclusions(raw_input, sections),
             'raw_content': raw_input,
-            'parsed_date': datetime.now().strftime('%Y-%m-%d')
+            'parsed_date': (now or datetime.now()).strftime('%Y-%m-%d')
         }
         
         return parsed
     
-    def _extract_title(self, text: str) -> str:
+    def _find_sections(self, text: str) -> Dict[str, str]:
+        """
+        Map each section kind to the body of its first occurrence.
+        
+        'insights' is the first Findings/Insights/Conclusions header
+        (optionally prefixed with 'Key'); every other kind is the singular,
+        lowercased header name (e.g. 'recommendation').
+        """
+        sections = {}
+        # Every section header starts with '#'
+        if '#' not in text:
+            return sections
+        
+        for match in _SECTION_RE.finditer(text):
+            name = match.group(1).lower()
+            has_key = name.startswith('key ')
+            if has_key:
+                name = name[4:]
+            if name.endswith('s') and name not in ('findings', 'insights'):
+                name = name[:-1]
+            
+            if name in ('finding', 'findings', 'insight', 'insights'):
+                kinds = ('insights',)
+            elif name == 'conclusion':
+                kinds = ('insights',) if has_key else ('insights', 'conclusion')
+            else:
+                kinds = (name,)
+            
+            body_end = text.find('\n##', match.end())
+            body = text[match.end():body_end if body_end != -1 else len(text)]
+            for kind in kinds:
+                sections.setdefault(kind, body)
+        
+        return sections
+    
+    def _extract_title(self, text: str, stripped: Optional[str] = None) -> str:
         """Extract or generate title from user research."""
         # Try to find markdown heading
-        heading_match = re.search(r'^#\s+(.+)$', text, re.MULTILINE)
+        heading_match = _TITLE_RE.search(text)
         if heading_match:
             return heading_match.group(1).strip()
         
+        if stripped is None:
+            stripped = text.strip()
+        
         # Try to find first line that looks like a title
-        lines = text.strip().split('\n')
-        if lines:
-            first_line = lines[0].strip()
-            # If first line is short and doesn't end with punctuation, use it as title
-            if len(first_line) < 100 and not first_line.endswith(('.', '!', '?')):
-                return first_line
+        first_line = stripped.partition('\n')[0].strip()
+        # If first line is short and doesn't end with punctuation, use it as title
+        if len(first_line) < 100 and not first_line.endswith(('.', '!', '?')):
+            return first_line
         
         # Generate title from first few words
-        words = text.strip().split()[:10]
+        words = stripped.split(None, 10)[:10]
         return ' '.join(words) + '...' if len(words) >= 10 else ' '.join(words)
     
-    def _extract_summary(self, text: str) -> str:
+    def _extract_summary(self, text: str, sections: Optional[Dict[str, str]] = None,
+                         stripped: Optional[str] = None) -> str:
         """Extract or generate summary from user research."""
+        if sections is None:
+            sections = self._find_sections(text)
+        
         # Look for explicit summary section
-        summary_patterns = [
-            r'##?\s*Summary\s*[:\n]+(.*?)(?=\n##|\Z)',
-            r'##?\s*Overview\s*[:\n]+(.*?)(?=\n##|\Z)',
-            r'##?\s*Abstract\s*[:\n]+(.*?)(?=\n##|\Z)'
-        ]
+        for kind in _SUMMARY_SECTIONS:
+            if kind in sections:
+                return sections[kind].strip()
         
-        for pattern in summary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        if stripped is None:
+            stripped = text.strip()
         
         # Use first paragraph as summary
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        paragraphs = [p for p in map(str.strip, stripped.split('\n\n')) if p]
         if paragraphs:
             # Skip if first paragraph looks like a title
             first_para = paragraphs[0]
@@ -123,111 +207,104 @@ class UserEvidenceParser:
                 return paragraphs[1]
         
         # Return first 200 characters
-        return text.strip()[:200] + '...' if len(text.strip()) > 200 else text.strip()
+        return stripped[:200] + '...' if len(stripped) > 200 else stripped
     
-    def _extract_key_insights(self, text: str) -> List[str]:
+    def _extract_key_insights(self, text: str, sections: Optional[Dict[str, str]] = None) -> List[str]:
         """Extract key insights/findings from user research."""
-        insights = []
-        
-        # Look for bulleted or numbered lists
-        bullet_patterns = [
-            r'^\s*[-*•]\s+(.+)$',  # Bullet points
-            r'^\s*\d+\.\s+(.+)$',   # Numbered lists
-        ]
+        if sections is None:
+            sections = self._find_sections(text)
         
-        for pattern in bullet_patterns:
-            matches = re.findall(pattern, text, re.MULTILINE)
-            insights.extend([m.strip() for m in matches if len(m.strip()) > 10])
+        # Deduplicate while preserving order, stopping once the limit is hit
+        unique_insights = {}
+        for insight in self._iter_insight_candidates(text, sections):
+            unique_insights.setdefault(insight)
+            if len(unique_insights) >= self.MAX_INSIGHTS:
+                break
         
-        # Look for explicit findings/insights sections
-        insight_patterns = [
-            r'##?\s*(?:Key )?(?:Findings?|Insights?|Conclusions?)\s*[:\n]+(.*?)(?=\n##|\Z)',
-        ]
+        # If no insights found, extract key sentences
+        if not unique_insights:
+            sentences = self._iter_sentences(text)
+            key_sentences = (s for s in sentences if 50 < len(s) < 200)
+            unique_insights = dict.fromkeys(islice(key_sentences, 3))
         
-        for pattern in insight_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                section_text = match.group(1)
-                # Extract sentences or paragraphs
-                sentences = [s.strip() for s in section_text.split('\n') if s.strip() and len(s.strip()) > 20]
-                insights.extend(sentences[:5])  # Limit to 5
+        return list(unique_insights)
+    
+    def _iter_sentences(self, text: str):
+        """Lazily yield stripped sentences, split on runs of '.', '!' or '?'."""
+        start = 0
+        for match in _SENTENCE_SPLIT_RE.finditer(text):
+            yield text[start:match.start()].strip()
+            start = match.end()
+        yield text[start:].strip()
+    
+    def _iter_insight_candidates(self, text: str, sections: Dict[str, str]):
+        """Yield list items (bullets before numbered), then insight section lines."""
+        # Look for bulleted or numbered lists
+        numbered = []
+        for marker, item in _BULLET_RE.findall(text):
+            item = item.strip()
+            if len(item) > 10:
+                if marker:
+                    yield item
+                else:
+                    numbered.append(item)
+        yield from numbered
         
-        # If no insights found, extract key sentences
-        if not insights:
-            sentences = re.split(r'[.!?]+', text)
-            key_sentences = [s.strip() for s in sentences if 50 < len(s.strip()) < 200]
-            insights = key_sentences[:3]
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_insights = []
-        for insight in insights:
-            if insight not in seen:
-                seen.add(insight)
-                unique_insights.append(insight)
-        
-        return unique_insights[:self.MAX_INSIGHTS]
+        # Look for explicit findings/insights sections
+        section_text = sections.get('insights')
+        if section_text is not None:
+            # Extract sentences or paragraphs
+            sentences = (s for s in map(str.strip, section_text.split('\n')) if len(s) > 20)
+            yield from islice(sentences, 5)  # Limit to 5
     
     def _extract_sources(self, text: str) -> List[Dict[str, str]]:
         """Extract source references from user research."""
         sources = []
         
         # Look for URLs
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, text)
-        for url in urls[:self.MAX_URLS]:
-            sources.append({'type': 'URL', 'reference': url})
+        if 'http' in text:
+            for match in islice(_URL_RE.finditer(text), self.MAX_URLS):
+                sources.append({'type': 'URL', 'reference': match.group(0)})
         
         # Look for citation patterns
-        citation_patterns = [
-            r'\[([^\]]+)\]\(([^)]+)\)',  # Markdown links
-            r'Source:\s*(.+)',
-            r'Reference:\s*(.+)',
-        ]
-        
-        for pattern in citation_patterns:
-            matches = re.findall(pattern, text, re.MULTILINE)
-            for match in matches[:self.MAX_CITATIONS]:
-                if isinstance(match, tuple):
-                    sources.append({'type': 'Citation', 'reference': f"{match[0]} - {match[1]}"})
+        for literal, pattern in _CITATION_RES:
+            if literal not in text:
+                continue
+            for match in islice(pattern.finditer(text), self.MAX_CITATIONS):
+                groups = match.groups()
+                if len(groups) > 1:
+                    sources.append({'type': 'Citation', 'reference': f"{groups[0]} - {groups[1]}"})
                 else:
-                    sources.append({'type': 'Citation', 'reference': match})
+                    sources.append({'type': 'Citation', 'reference': groups[0]})
         
         return sources
     
-    def _extract_methodology(self, text: str) -> str:
+    def _extract_methodology(self, text: str, sections: Optional[Dict[str, str]] = None) -> str:
         """Extract methodology description if present."""
-        method_patterns = [
-            r'##?\s*Methodology\s*[:\n]+(.*?)(?=\n##|\Z)',
-            r'##?\s*Method\s*[:\n]+(.*?)(?=\n##|\Z)',
-            r'##?\s*Approach\s*[:\n]+(.*?)(?=\n##|\Z)',
-        ]
+        if sections is None:
+            sections = self._find_sections(text)
         
-        for pattern in method_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        for kind in _METHOD_SECTIONS:
+            if kind in sections:
+                return sections[kind].strip()
         
         return ""
     
-    def _extract_conclusions(self, text: str) -> str:
+    def _extract_conclusions(self, text: str, sections: Optional[Dict[str, str]] = None) -> str:
         """Extract conclusions/recommendations if present."""
-        conclusion_patterns = [
-            r'##?\s*Conclusions?\s*[:\n]+(.*?)(?=\n##|\Z)',
-            r'##?\s*Recommendations?\s*[:\n]+(.*?)(?=\n##|\Z)',
-            r'##?\s*Takeaways?\s*[:\n]+(.*?)(?=\n##|\Z)',
-        ]
+        if sections is None:
+            sections = self._find_sections(text)
         
-        for pattern in conclusion_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
+        for kind in _CONCLUSION_SECTIONS:
+            if kind in sections:
+                return sections[kind].strip()
         
         return ""
     
     def reformat_to_evidence(self, parsed_data: Dict[str, Any], 
                             user_priority: bool = False,
-                            curator: str = "User") -> str:
+                            curator: str = "User",
+                            evidence_id: str = "EVD-####") -> str:
         """
         Reformat parsed user research to EVD-#### format.
         
@@ -238,86 +315,102 @@ class UserEvidenceParser:
             parsed_data: Dictionary from parse_user_research()
             user_priority: If True, marks this evidence as having explicit user priority
             curator: Name of the person who provided the research
+            evidence_id: ID to place in the heading (defaults to the 'EVD-####'
+                         placeholder)
             
         Returns:
             Formatted EVD markdown content
         """
+        sources = parsed_data.get('sources')
+        parsed_date = parsed_data['parsed_date']
+        
+        # Raw content preview and completeness, derived from a single length
+        raw = parsed_data['raw_content']
+        raw_len = len(raw)
+        preview = raw[:self.RAW_CONTENT_PREVIEW_CHARS]
+        truncated = '...' if raw_len > self.RAW_CONTENT_PREVIEW_CHARS else ''
+        completeness = 'Complete' if raw_len > 200 else 'Partial'
+        
         # Build source information
         source_type = "User-Provided Research"
         source_url = "User input"
-        if parsed_data.get('sources'):
-            first_source = parsed_data['sources'][0]
+        if sources:
+            first_source = sources[0]
             if first_source.get('type') == 'URL':
                 source_url = first_source['reference']
         
         # Build key insights list
-        insights_list = '\n'.join([f"{i+1}. {insight}" 
-                                   for i, insight in enumerate(parsed_data.get('key_insights', []))])
-        if not insights_list:
+        insights = parsed_data.get('key_insights')
+        if insights:
+            insights_list = '\n'.join(f"{i}. {insight}" for i, insight in enumerate(insights, 1))
+        else:
             insights_list = "1. User-provided research findings documented for traceability."
         
+        # Generate EVD content as a list of chunks, joined once at the end
+        parts = [
+            f"# {evidence_id} — {parsed_data['title']}\n"
+            "\n"
+            "> User-provided research, automatically parsed and reformatted to EVD template structure.\n"
+            "\n"
+            f"**Harvested:** {parsed_date}\n"
+            f"**Curator:** {curator}\n"
+            "**Status:** Curated\n"
+            "**Source:** User-Provided",
+        ]
+        
+        # Priority indicator
+        if user_priority:
+            parts.append("\n\n> **Note:** This evidence has been marked by the user as having elevated priority in decision-making.")
+        
+        parts.append(
+            "\n"
+            "\n"
+            "## Source Information\n"
+            "\n"
+            f"- **Source Type:** {source_type}\n"
+            f"- **Source URL:** {source_url}\n"
+            f"- **Source Date:** {parsed_date}\n"
+            "- **Recency Status:** Current (user-provided)\n"
+            "\n"
+            "## Summary\n"
+            "\n"
+            f"{parsed_data['summary']}\n"
+            "\n"
+            "## Raw Content\n"
+            "\n"
+            "> Original user-provided content preserved for traceability:\n"
+            "\n"
+            "```\n"
+            f"{preview}{truncated}\n"
+            "```\n"
+            "\n"
+            "## Key Insights\n"
+            "\n"
+            f"{insights_list}\n"
+        )
+        
         # Build source references section
-        sources_text = ""
-        if parsed_data.get('sources'):
-            sources_text = "\n\n### Additional Sources\n\n"
-            for source in parsed_data['sources']:
-                sources_text += f"- {source['type']}: {source['reference']}\n"
+        if sources:
+            parts.append("\n\n### Additional Sources\n\n")
+            for source in sources:
+                parts.append(f"- {source['type']}: {source['reference']}\n")
         
         # Build methodology section if present
-        methodology_text = ""
         if parsed_data.get('methodology'):
-            methodology_text = f"\n\n### Research Methodology\n\n{parsed_data['methodology']}"
+            parts.append(f"\n\n### Research Methodology\n\n{parsed_data['methodology']}")
         
         # Build conclusions section if present
-        conclusions_text = ""
         if parsed_data.get('conclusions'):
-            conclusions_text = f"\n\n### Conclusions\n\n{parsed_data['conclusions']}"
+            parts.append(f"\n\n### Conclusions\n\n{parsed_data['conclusions']}")
         
-        # Priority indicator
-        priority_note = ""
-        if user_priority:
-            priority_note = "\n\n> **Note:** This evidence has been marked by the user as having elevated priority in decision-making."
-        
-        # Generate EVD content
-        evd_content = f"""# EVD-#### — {parsed_data['title']}
-
-> User-provided research, automatically parsed and reformatted to EVD template structure.
-
-**Harvested:** {parsed_data['parsed_date']}
-**Curator:** {curator}
-**Status:** Curated
-**Source:** User-Provided{priority_note}
-
-## Source Information
-
-- **Source Type:** {source_type}
-- **Source URL:** {source_url}
-- **Source Date:** {parsed_data['parsed_date']}
-- **Recency Status:** Current (user-provided)
-
-## Summary
-
-{parsed_data['summary']}
-
-## Raw Content
-
-> Original user-provided content preserved for traceability:
-
-```
-{parsed_data['raw_content'][:self.RAW_CONTENT_PREVIEW_CHARS]}{'...' if len(parsed_data['raw_content']) > self.RAW_CONTENT_PREVIEW_CHARS else ''}
-```
-
-## Key Insights
-
-{insights_list}
-{sources_text}{methodology_text}{conclusions_text}
+        parts.append(f"""
 
 ## Relevance Assessment
 
 ### Quality Indicators
 
 - **Credibility:** User-Provided — Direct input from project stakeholder
-- **Completeness:** {'Complete' if len(parsed_data['raw_content']) > 200 else 'Partial'}
+- **Completeness:** {completeness}
 - **Corroboration:** Standalone (user-provided research)
 - **User Priority:** {'Elevated (explicitly specified)' if user_priority else 'Standard (equal weight to agent research)'}
 
@@ -346,10 +439,30 @@ User research is particularly relevant when the user makes a requirement request
 
 | Date | Version | Author | Changes |
 |------|---------|--------|---------|
-| {parsed_data['parsed_date']} | 1.0 | {curator} | Initial user-provided research (auto-parsed) |
-"""
+| {parsed_date} | 1.0 | {curator} | Initial user-provided research (auto-parsed) |
+""")
         
-        return evd_content
+        return ''.join(parts)
+
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
+class EvidenceRecord(_RecordMapping):
+    """
+    Registry entry for a single piece of evidence.
+    
+    Entries loaded from disk only know their path; harvested entries fill in
+    the remaining fields. Fields left as None are treated as unset, so the
+    record reads as a mapping with the same keys as the dictionary entries
+    it replaces (``record['topic']``, ``'curator' in record``).
+    """
+    path: str
+    topic: Optional[str] = None
+    created: Optional[datetime] = None
+    source_type: Optional[str] = None
+    source_url: Optional[str] = None
+    user_provided: Optional[bool] = None
+    user_priority: Optional[bool] = None
+    curator: Optional[str] = None
 
 
 class ResearchHarvester:
@@ -378,22 +491,93 @@ class ResearchHarvester:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # String prefix for evidence file paths, so saving skips Path objects
+        self._output_prefix = os.path.join(os.fspath(self.output_dir), '')
+        
+        # TemplateManager is created on first use (see template_manager), so
+        # lookup-only callers never touch the templates directory
+        self._templates_dir = templates_dir
+        self._template_manager: Optional[TemplateManager] = None
+        self.evidence_registry: Dict[str, EvidenceRecord] = {}
+        
+        # Lowercased topic of each harvested entry, so topic filtering does
+        # not re-lowercase every topic on every query
+        self._topics_lower: Dict[str, str] = {}
+        
+        # Highest EVD number issued or found on disk; the next ID is one past it
+        self._max_evd_num = 0
         
-        self.template_manager = TemplateManager(templates_dir)
-        self.evidence_registry: Dict[str, Dict] = {}
+        # Created on first use by harvest_user_research and reused afterwards
+        self._user_parser: Optional[UserEvidenceParser] = None
         
         # Load existing evidence files
         self._load_existing_evidence()
     
+    @property
+    def template_manager(self) -> TemplateManager:
+        """TemplateManager for generating artifacts, created on first access."""
+        if self._template_manager is None:
+            self._template_manager = TemplateManager(self._templates_dir)
+        return self._template_manager
+    
+    @template_manager.setter
+    def template_manager(self, template_manager: TemplateManager):
+        self._template_manager = template_manager
+    
     def _load_existing_evidence(self):
         """Scan output directory for existing EVD files and register them."""
-        if self.output_dir.exists():
-            for file_path in self.output_dir.glob("EVD-*.md"):
-                evd_id = file_path.stem
-                self.evidence_registry[evd_id] = {
-                    'path': str(file_path),
-                    'loaded': datetime.now()
-                }
+        if not self.output_dir.exists():
+            return
+        
+        # Filter on the name alone: EVD files are written by this class as
+        # regular files, so no per-entry stat()/is_file() call is needed
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith('EVD-') and name.endswith('.md')):
+                    continue
+                evd_id = name[:-3]
+                self.evidence_registry[evd_id] = EvidenceRecord(path=entry.path)
+                match = _EVD_NUM_RE.match(evd_id)
+                if match:
+                    self._max_evd_num = max(self._max_evd_num, int(match.group(1)))
+    
+    def _write_evidence(self, render: Callable[[str], str]) -> Tuple[str, str]:
+        """
+        Write a new EVD file under the next free evidence ID.
+        
+        The file is created exclusively, so an ID whose file was written since
+        the directory was scanned (e.g. by another harvester) is skipped rather
+        than overwritten. The counter only moves past an ID once its file has
+        been written, so a failed write does not use up the ID.
+        
+        Args:
+            render: Builds the file content for a given evidence ID
+            
+        Returns:
+            Tuple of (evidence ID, path of the written file)
+        """
+        template_manager = self.template_manager
+        number = self._max_evd_num
+        while True:
+            number += 1
+            evd_id = template_manager.format_artifact_id('EVD', number)
+            output_path = f"{self._output_prefix}{evd_id}.md"
+            content = render(evd_id)
+            try:
+                f = open(output_path, 'x', encoding='utf-8')
+            except FileExistsError:
+                # Written since the directory was scanned; register it as loaded
+                self.evidence_registry.setdefault(evd_id, EvidenceRecord(path=output_path))
+                continue
+            try:
+                with f:
+                    f.write(content)
+            except BaseException:
+                os.remove(output_path)
+                raise
+            self._max_evd_num = number
+            return evd_id, output_path
     
     def harvest(self, 
                 topic: str,
@@ -427,36 +611,31 @@ class ResearchHarvester:
         if not topic or not topic.strip():
             raise ValueError("Topic cannot be empty")
         
-        # Generate next evidence ID
-        existing_ids = list(self.evidence_registry.keys())
-        evd_id = self.template_manager.generate_artifact_id('EVD', existing_ids)
-        
         # Simulate research gathering (in production, this would query external sources)
         summary, key_insights = self._conduct_research(topic, raw_content)
         
-        # Generate evidence file
-        evidence_content = self.template_manager.fill_evidence_template(
-            evidence_id=evd_id,
-            title=f"Research: {topic}",
-            source_type=source_type,
-            source_url=source_url or f"Research query: {topic}",
-            summary=summary,
-            key_insights=key_insights,
-            curator=curator
+        # Generate and save the evidence file (output_dir is created in __init__)
+        evd_id, output_path = self._write_evidence(
+            lambda evidence_id: self.template_manager.fill_evidence_template(
+                evidence_id=evidence_id,
+                title=f"Research: {topic}",
+                source_type=source_type,
+                source_url=source_url or f"Research query: {topic}",
+                summary=summary,
+                key_insights=key_insights,
+                curator=curator
+            )
         )
         
-        # Save evidence file
-        output_path = self.output_dir / f"{evd_id}.md"
-        self.template_manager.save_artifact(evidence_content, str(output_path))
-        
         # Register evidence
-        self.evidence_registry[evd_id] = {
-            'topic': topic,
-            'path': str(output_path),
-            'created': datetime.now(),
-            'source_type': source_type,
-            'source_url': source_url
-        }
+        self.evidence_registry[evd_id] = EvidenceRecord(
+            path=output_path,
+            topic=topic,
+            created=datetime.now(),
+            source_type=source_type,
+            source_url=source_url
+        )
+        self._topics_lower[evd_id] = topic.lower()
         
         return evd_id
     
@@ -485,38 +664,36 @@ class ResearchHarvester:
         Raises:
             ValueError: If raw_input is empty
         """
-        # Parse user research
-        parser = UserEvidenceParser(self.template_manager)
-        parsed_data = parser.parse_user_research(raw_input)
+        # Read the clock once; the parse date and registry entry share it
+        now = datetime.now()
         
-        # Generate next evidence ID
-        existing_ids = list(self.evidence_registry.keys())
-        evd_id = self.template_manager.generate_artifact_id('EVD', existing_ids)
+        # Parse user research
+        parser = self._user_parser
+        if parser is None:
+            parser = self._user_parser = UserEvidenceParser(self.template_manager)
+        parsed_data = parser.parse_user_research(raw_input, now=now)
+        
+        # Reformat to EVD template and save it (output_dir is created in __init__)
+        evd_id, output_path = self._write_evidence(
+            lambda evidence_id: parser.reformat_to_evidence(
+                parsed_data,
+                user_priority=user_priority,
+                curator=curator,
+                evidence_id=evidence_id
+            )
+        )
         
-        # Reformat to EVD template
-        evidence_content = parser.reformat_to_evidence(
-            parsed_data, 
+        # Register evidence
+        self.evidence_registry[evd_id] = EvidenceRecord(
+            path=output_path,
+            topic=parsed_data['title'],
+            created=now,
+            source_type='User-Provided',
+            user_provided=True,
             user_priority=user_priority,
             curator=curator
         )
-        
-        # Replace placeholder with actual ID
-        evidence_content = evidence_content.replace('EVD-####', evd_id)
-        
-        # Save evidence file
-        output_path = self.output_dir / f"{evd_id}.md"
-        self.template_manager.save_artifact(evidence_content, str(output_path))
-        
-        # Register evidence
-        self.evidence_registry[evd_id] = {
-            'topic': parsed_data['title'],
-            'path': str(output_path),
-            'created': datetime.now(),
-            'source_type': 'User-Provided',
-            'user_provided': True,
-            'user_priority': user_priority,
-            'curator': curator
-        }
+        self._topics_lower[evd_id] = parsed_data['title'].lower()
         
         return evd_id
     
@@ -535,23 +712,30 @@ class ResearchHarvester:
             raw_content: Optional raw content to analyze
             
         Returns:
-            Tuple of (summary, key_insights_list)
+            Tuple of (summary, key_insights), where key_insights is a tuple
         """
-        # Simulated research output
-        if raw_content:
+        # The simulated output depends only on whether content was provided, so
+        # cache on that flag rather than keeping large raw_content strings alive
+        return self._simulated_research(topic, bool(raw_content))
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _simulated_research(topic: str, has_content: bool) -> tuple:
+        """Build the (cached) simulated summary and insights for a topic."""
+        if has_content:
             summary = f"Research findings on '{topic}' based on provided content."
-            key_insights = [
+            key_insights = (
                 "Content has been analyzed for relevant patterns.",
                 "Key concepts extracted from source material.",
                 "Findings documented for traceability."
-            ]
+            )
         else:
             summary = f"Comprehensive research conducted on '{topic}' to establish evidence base."
-            key_insights = [
+            key_insights = (
                 f"Industry best practices for {topic} have been documented.",
                 f"Technical specifications and standards related to {topic} have been reviewed.",
                 f"Trade-offs and considerations for {topic} have been identified."
-            ]
+            )
         
         return summary, key_insights
     
@@ -565,7 +749,8 @@ class ResearchHarvester:
         Returns:
             Evidence metadata dictionary or None if not found
         """
-        return self.evidence_registry.get(evd_id)
+        record = self.evidence_registry.get(evd_id)
+        return record.to_dict() if record is not None else None
     
     def validate_evidence_exists(self, evd_id: str) -> bool:
         """
@@ -593,11 +778,12 @@ class ResearchHarvester:
             List of evidence IDs
         """
         if topic_filter:
+            needle = topic_filter.lower()
             return [
-                evd_id for evd_id, data in self.evidence_registry.items()
-                if 'topic' in data and topic_filter.lower() in data['topic'].lower()
+                evd_id for evd_id, topic in self._topics_lower.items()
+                if needle in topic
             ]
-        return list(self.evidence_registry.keys())
+        return list(self.evidence_registry)
     
     def require_evidence_for_artifact(self, artifact_type: str, 
                                       evidence_refs: List[str],
@@ -633,7 +819,7 @@ class ResearchHarvester:
                 return True
         
         # Standard evidence requirement for non-user requirements
-        if artifact_type in ['DEC', 'SPEC', 'REQ'] and not evidence_refs and not is_user_requirement:
+        if artifact_type in _EVIDENCE_REQUIRED_ARTIFACTS and not evidence_refs and not is_user_requirement:
             raise ValueError(
                 f"Cannot create {artifact_type} without evidence references. "
                 f"Harvest evidence first using ResearchHarvester.harvest(). "
@@ -641,11 +827,17 @@ class ResearchHarvester:
             )
         
         # Validate provided evidence references
-        invalid_refs = [ref for ref in evidence_refs if not self.validate_evidence_exists(ref)]
+        registry = self.evidence_registry
+        # Fast path: one C-level set difference; only rebuild an ordered list
+        # of offenders when something is actually missing
+        if evidence_refs and set(evidence_refs).difference(registry):
+            invalid_refs = [ref for ref in evidence_refs if ref not in registry]
+        else:
+            invalid_refs = []
         if invalid_refs:
             raise ValueError(
                 f"Invalid evidence references: {invalid_refs}. "
-                f"These EVD IDs do not exist. Available: {list(self.evidence_registry.keys())}"
+                f"These EVD IDs do not exist. Available: {list(registry)}"
             )
         
         return True
@@ -1,4 +1,4 @@
 """Governance and autonomy module for RJW-IDD agent framework."""
-from .manager import GovernanceManager, TrustLevel, ChecklistEnforcer, ChecklistStatus
+from .manager import GovernanceManager, TrustLevel, ChecklistEnforcer, ChecklistStatus, ApprovalRecord
 
-__all__ = ['GovernanceManager', 'TrustLevel', 'ChecklistEnforcer', 'ChecklistStatus']
+__all__ = ['GovernanceManager', 'TrustLevel', 'ChecklistEnforcer', 'ChecklistStatus', 'ApprovalRecord']
@@ -4,12 +4,21 @@ Governance & Autonomy Module
 Implements the GovernanceManager with trust-based approval mechanisms.
 This enforces METHOD-0004 trust ladder and METHOD-0002 checklist requirements.
 """
-from enum import Enum
-from typing import Dict, List, Optional, Callable
+import os
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Callable, Sequence, Tuple, Union
 from datetime import datetime
+from ..utils import _DATACLASS_SLOTS, _RecordMapping, _json_dumps
 
 
-class TrustLevel(Enum):
+class TrustLevel(IntEnum):
     """Trust levels for agent autonomy (METHOD-0004 Section 1.2)."""
     SUPERVISED = 0  # All actions require approval
     GUIDED = 1  # Routine actions auto-approved
@@ -24,6 +33,159 @@ class RiskLevel(Enum):
     PROTOTYPE = "prototype"  # POC/spike/experimental work
 
 
+# Trust level names, looked up directly instead of via the Enum descriptor
+_TRUST_NAME: Dict[TrustLevel, str] = {level: level.name for level in TrustLevel}
+
+# Legacy risk levels each trust level may auto-approve (METHOD-0004)
+_TRUST_AUTHORIZATIONS: Dict[TrustLevel, frozenset] = {
+    TrustLevel.SUPERVISED: frozenset({'minimal', 'low'}),
+    TrustLevel.GUIDED: frozenset({'minimal', 'low', 'medium'}),
+    TrustLevel.AUTONOMOUS: frozenset({'minimal', 'low', 'medium', 'high', 'streamlined', 'prototype'}),
+    TrustLevel.TRUSTED_PARTNER: frozenset({'minimal', 'low', 'medium', 'high', 'critical',
+                                           'streamlined', 'yolo', 'prototype'}),
+}
+
+_NO_AUTHORIZATIONS: frozenset = frozenset()
+
+# Minimum trust level value for each deployment pathway (METHOD-0002):
+# streamlined and prototype at GUIDED and above, YOLO at AUTONOMOUS and above
+_PATHWAY_MIN_TRUST: Dict[str, int] = {
+    'streamlined': TrustLevel.GUIDED.value,
+    'prototype': TrustLevel.GUIDED.value,
+    'yolo': TrustLevel.AUTONOMOUS.value,
+}
+
+# Pathway documentation reference for each risk level (METHOD-0002 Section 2)
+_PATHWAY_DOCS: Dict[RiskLevel, str] = {
+    RiskLevel.STREAMLINED: "Section 2.1 - Streamlined Path (production-ready changes)",
+    RiskLevel.YOLO: "Section 2.2 - YOLO Path (autonomous self-approval)",
+    RiskLevel.PROTOTYPE: "Section 2.3 - Prototype Path (POC/spike/experimental)"
+}
+
+# Approval reasons; the trust-based ones are built once per combination
+_REASON_YOLO_PASS = "Auto-approved (YOLO mode) - checklist passed"
+_REASON_YOLO_FAIL = "Auto-rejected (YOLO mode) - checklist failed"
+
+
+@lru_cache(maxsize=256)
+def _trust_reason(trust_name: str, risk_level: str, approved: bool) -> str:
+    """Reason text for a standard-mode (trust ladder) approval decision."""
+    if approved:
+        return f"Auto-approved - Trust level {trust_name} authorized for {risk_level} risk"
+    return f"Manual approval required - Trust level {trust_name} insufficient for {risk_level} risk or checklist failed"
+
+
+# Wall-clock nanoseconds; records store this and format ISO strings on read
+_now_ns = time.time_ns
+
+
+def _format_ts(ts_ns: int) -> str:
+    """Format a time.time_ns() value like datetime.now().isoformat()."""
+    seconds, nanos = divmod(ts_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+
+class _LogRecord(_RecordMapping):
+    """
+    Read-only mapping view shared by approval log records.
+    
+    Records keep the raw ``ts_ns`` timestamp; the ISO ``timestamp`` string is
+    only formatted when it is read. As a mapping, a record exposes the same
+    keys, in the same order, as the dictionary returned by to_dict(). Records
+    are not changed once logged, so that dictionary is built only once.
+    """
+    __slots__ = ('_dict',)
+    
+    _hidden_fields = frozenset({'ts_ns'})
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 local time at which the record was logged."""
+        return _format_ts(self.ts_ns)
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        # 'timestamp' stands in for the raw ts_ns field
+        return {'timestamp': self.timestamp, **super()._build_dict()}
+    
+    def _as_dict(self) -> Dict[str, Any]:
+        try:
+            return self._dict
+        except AttributeError:
+            self._dict = self._build_dict()
+            return self._dict
+
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
+class ApprovalRecord(_LogRecord):
+    """Approval log entry for a single request_approval decision."""
+    ts_ns: int
+    action: str
+    phase: str
+    approved: bool
+    mode: str
+    reason: str
+    risk_level: str
+    trust_level: str
+    checklist_passed: bool
+    yolo_mode: bool
+
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
+class SettingChangeRecord(_LogRecord):
+    """Approval log entry for a YOLO mode or trust level change."""
+    ts_ns: int
+    action: str
+    previous: Any
+    current: Any
+    reason: str
+
+
+def _write_records(path: str, pending: List[_LogRecord]):
+    """Append pending records to a JSON-lines file, then clear them."""
+    if not pending:
+        return
+    data = b''.join(_json_dumps(record._as_dict()) + b'\n' for record in pending)
+    with open(path, 'ab') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    # Only drop the batch once it is on disk, so a failed write can be retried
+    del pending[:]
+
+
+class _ApprovalSink:
+    """
+    Appends approval log records to a JSON-lines file in batches.
+    
+    Records are buffered in memory and written with a single write() and
+    fsync() once ``batch_size`` records are pending, or when flush() or
+    close() is called. Anything still pending is flushed when the sink is
+    garbage collected or the interpreter exits.
+    """
+    
+    __slots__ = ('path', 'batch_size', '_pending', '_finalizer', '__weakref__')
+    
+    def __init__(self, path: str, batch_size: int = 64):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self._pending: List[_LogRecord] = []
+        self._finalizer = weakref.finalize(self, _write_records, path, self._pending)
+    
+    def enqueue(self, record: _LogRecord):
+        """Buffer a record, flushing once a full batch is pending."""
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """Write all pending records to disk."""
+        _write_records(self.path, self._pending)
+    
+    def close(self):
+        """Flush any pending records."""
+        self.flush()
+
+
 class ChecklistStatus(Enum):
     """Status of checklist validation."""
     NOT_STARTED = "not_started"
@@ -32,6 +194,87 @@ class ChecklistStatus(Enum):
     FAILED = "failed"
 
 
+def _artifact_present(key: str) -> Callable[[Dict], bool]:
+    """Build a checklist check that passes when ``artifacts[key]`` is non-empty."""
+    return lambda artifacts: bool(artifacts.get(key))
+
+
+def _always_true(artifacts: Dict) -> bool:
+    """Checklist check for items that have no automated validation."""
+    return True
+
+
+# Phase gate checklists (METHOD-0002): phase -> (item, required) pairs
+_PHASE_CHECKLISTS: Mapping[str, Tuple[Tuple[str, bool], ...]] = MappingProxyType({
+    'research': (
+        ('Evidence harvested', True),
+        ('Sources documented', True),
+        ('Key insights extracted', True)
+    ),
+    'decision': (
+        ('Evidence references provided', True),
+        ('Options evaluated', True),
+        ('Rationale documented', True)
+    ),
+    'specification': (
+        ('Requirements defined', True),
+        ('Evidence backing provided', True),
+        ('Technical design complete', True)
+    ),
+    'implementation': (
+        ('Tests written', True),
+        ('Code implements spec', True),
+        ('Tests passing', True)
+    )
+})
+
+# Automated check for each checklist item, keyed by phase then item;
+# items without an entry always pass
+_PHASE_ITEM_HANDLERS: Dict[str, Dict[str, Callable[[Dict], bool]]] = {
+    'research': {
+        'Evidence harvested': _artifact_present('evidence_ids'),
+        'Sources documented': _artifact_present('evidence_ids'),
+    },
+    'decision': {
+        'Evidence references provided': _artifact_present('evidence_refs'),
+        'Options evaluated': _artifact_present('options'),
+    },
+    'specification': {
+        'Requirements defined': _artifact_present('requirements'),
+        'Evidence backing provided': _artifact_present('evidence_refs'),
+    },
+    'implementation': {
+        'Tests written': _artifact_present('test_files'),
+        'Tests passing': lambda artifacts: artifacts.get('tests_passing', False),
+    },
+}
+
+def _checklist_pairs(checklist) -> Iterator[Tuple[str, bool]]:
+    """Yield (item, required) from (item, required) pairs or item dicts."""
+    for entry in checklist:
+        if isinstance(entry, Mapping):
+            yield entry['item'], entry.get('required', False)
+        else:
+            yield entry
+
+
+def _required_checks(phase: str, checklist) -> Tuple[Callable[[Dict], bool], ...]:
+    """Resolve the checks for the required items of one phase checklist."""
+    handlers = _PHASE_ITEM_HANDLERS.get(phase, {})
+    return tuple(
+        handlers.get(item, _always_true)
+        for item, required in _checklist_pairs(checklist)
+        if required
+    )
+
+
+# Checks for each phase's required items, so validation never looks items up
+_PHASE_CHECKS: Mapping[str, Tuple[Callable[[Dict], bool], ...]] = MappingProxyType({
+    phase: _required_checks(phase, checklist)
+    for phase, checklist in _PHASE_CHECKLISTS.items()
+})
+
+
 class ChecklistEnforcer:
     """
     Enforces phase gate checklists per METHOD-0002.
@@ -40,104 +283,55 @@ class ChecklistEnforcer:
     proceeding to the next phase.
     """
     
+    __slots__ = ('checklists', 'validation_results')
+    
     def __init__(self):
         """Initialize the ChecklistEnforcer."""
-        self.checklists: Dict[str, List[Dict]] = {
-            'research': [
-                {'item': 'Evidence harvested', 'required': True},
-                {'item': 'Sources documented', 'required': True},
-                {'item': 'Key insights extracted', 'required': True}
-            ],
-            'decision': [
-                {'item': 'Evidence references provided', 'required': True},
-                {'item': 'Options evaluated', 'required': True},
-                {'item': 'Rationale documented', 'required': True}
-            ],
-            'specification': [
-                {'item': 'Requirements defined', 'required': True},
-                {'item': 'Evidence backing provided', 'required': True},
-                {'item': 'Technical design complete', 'required': True}
-            ],
-            'implementation': [
-                {'item': 'Tests written', 'required': True},
-                {'item': 'Code implements spec', 'required': True},
-                {'item': 'Tests passing', 'required': True}
-            ]
-        }
-        
+        # Each phase maps to (item, required) pairs. Instances share the
+        # read-only default table until a caller assigns their own checklists
+        # (as (item, required) pairs or {'item': ..., 'required': ...} dicts).
+        self.checklists: Mapping[str, Sequence] = _PHASE_CHECKLISTS
         self.validation_results: Dict[str, ChecklistStatus] = {}
     
-    def validate_phase(self, phase: str, artifacts: Dict) -> bool:
+    def validate_phase(self, phase: str, artifacts: Dict, fail_fast: bool = True) -> bool:
         """
         Validate that a phase meets its checklist requirements.
         
         Args:
             phase: Phase to validate ('research', 'decision', 'specification', 'implementation')
             artifacts: Dictionary of artifacts for validation
+            fail_fast: Stop at the first failing required item (default: True).
+                       Set to False to run every item check.
             
         Returns:
             True if all required checklist items pass
         """
-        if phase not in self.checklists:
-            raise ValueError(f"Unknown phase: {phase}")
-        
-        checklist = self.checklists[phase]
-        all_passed = True
+        checklists = self.checklists
+        if checklists is _PHASE_CHECKLISTS:
+            # Default table: checks were resolved once at import
+            checks = _PHASE_CHECKS.get(phase)
+            if checks is None:
+                raise ValueError(f"Unknown phase: {phase}")
+        else:
+            if phase not in checklists:
+                raise ValueError(f"Unknown phase: {phase}")
+            checks = _required_checks(phase, checklists[phase])
         
-        for item in checklist:
-            if item['required']:
-                # Check if required artifact exists
-                passed = self._check_item(phase, item['item'], artifacts)
-                if not passed:
-                    all_passed = False
+        if fail_fast:
+            all_passed = all(check(artifacts) for check in checks)
+        else:
+            # Run every check, even after one has failed
+            all_passed = all([bool(check(artifacts)) for check in checks])
         
         status = ChecklistStatus.PASSED if all_passed else ChecklistStatus.FAILED
         self.validation_results[phase] = status
         
         return all_passed
     
-    def _check_item(self, phase: str, item: str, artifacts: Dict) -> bool:
-        """
-        Check a specific checklist item.
-        
-        Args:
-            phase: Current phase
-            item: Checklist item description
-            artifacts: Available artifacts
-            
-        Returns:
-            True if item requirement is met
-        """
-        # Simple validation logic
-        if phase == 'research':
-            if 'Evidence harvested' in item:
-                return bool(artifacts.get('evidence_ids'))
-            if 'Sources documented' in item:
-                return bool(artifacts.get('evidence_ids'))
-        
-        elif phase == 'decision':
-            if 'Evidence references' in item:
-                return bool(artifacts.get('evidence_refs'))
-            if 'Options evaluated' in item:
-                return bool(artifacts.get('options'))
-        
-        elif phase == 'specification':
-            if 'Requirements defined' in item:
-                return bool(artifacts.get('requirements'))
-            if 'Evidence backing' in item:
-                return bool(artifacts.get('evidence_refs'))
-        
-        elif phase == 'implementation':
-            if 'Tests written' in item:
-                return bool(artifacts.get('test_files'))
-            if 'Tests passing' in item:
-                return artifacts.get('tests_passing', False)
-        
-        return True
-    
     def get_checklist(self, phase: str) -> List[Dict]:
         """Get checklist for a specific phase."""
-        return self.checklists.get(phase, [])
+        return [{'item': item, 'required': required}
+                for item, required in _checklist_pairs(self.checklists.get(phase, ()))]
 
 
 class RiskClassifier:
@@ -148,6 +342,8 @@ class RiskClassifier:
     High, Critical, Prototype) into exactly 3 pathways per METHOD-0002.
     """
     
+    __slots__ = ()
+    
     def classify(self, change: Dict) -> RiskLevel:
         """
         Classify change into one of three deployment pathways.
@@ -181,12 +377,7 @@ class RiskClassifier:
         Returns:
             String describing the pathway
         """
-        pathways = {
-            RiskLevel.STREAMLINED: "Section 2.1 - Streamlined Path (production-ready changes)",
-            RiskLevel.YOLO: "Section 2.2 - YOLO Path (autonomous self-approval)",
-            RiskLevel.PROTOTYPE: "Section 2.3 - Prototype Path (POC/spike/experimental)"
-        }
-        return pathways[risk_level]
+        return _PATHWAY_DOCS[risk_level]
 
 
 class GovernanceManager:
@@ -202,23 +393,54 @@ class GovernanceManager:
         yolo_mode: If True, enables self-approval with checklist validation
         trust_level: Current trust level of the agent
         checklist_enforcer: Instance for validating phase gates
-        approval_log: Log of all approval decisions
+        approval_log: Log of approval decisions (oldest evicted past max_log_size)
     """
     
+    __slots__ = ('yolo_mode', '_trust_level', '_trust_value', '_trust_name',
+                 'checklist_enforcer', 'approval_log', '_audit_sink')
+    
     def __init__(self, 
                  yolo_mode: bool = False,
-                 trust_level: TrustLevel = TrustLevel.SUPERVISED):
+                 trust_level: TrustLevel = TrustLevel.SUPERVISED,
+                 max_log_size: int = 100_000,
+                 audit_log_path: Optional[str] = None,
+                 audit_batch_size: int = 64):
         """
         Initialize the GovernanceManager.
         
         Args:
             yolo_mode: Enable self-approval mode (default: False)
             trust_level: Initial trust level (default: SUPERVISED)
+            max_log_size: Maximum approval records kept; older records are
+                          dropped once the log is full (default: 100000)
+            audit_log_path: Optional JSON-lines file that every log record is
+                            also appended to (default: None, memory only)
+            audit_batch_size: Records buffered before each write to
+                              audit_log_path (default: 64)
         """
         self.yolo_mode = yolo_mode
         self.trust_level = trust_level
         self.checklist_enforcer = ChecklistEnforcer()
-        self.approval_log: List[Dict] = []
+        self.approval_log: Deque[Union[ApprovalRecord, SettingChangeRecord]] = deque(maxlen=max_log_size)
+        self._audit_sink: Optional[_ApprovalSink] = (
+            _ApprovalSink(audit_log_path, audit_batch_size) if audit_log_path else None
+        )
+    
+    def _log(self, record: Union[ApprovalRecord, SettingChangeRecord]):
+        """Add a record to the approval log and the audit sink, if any."""
+        self.approval_log.append(record)
+        if self._audit_sink is not None:
+            self._audit_sink.enqueue(record)
+    
+    def flush_audit_log(self):
+        """Write any buffered records to the audit log file."""
+        if self._audit_sink is not None:
+            self._audit_sink.flush()
+    
+    def close(self):
+        """Flush the audit log now rather than when the manager is discarded."""
+        if self._audit_sink is not None:
+            self._audit_sink.close()
     
     def request_approval(self, 
                         action: str,
@@ -244,17 +466,17 @@ class GovernanceManager:
             - reason: str
             - checklist_status: ChecklistStatus
         """
-        timestamp = datetime.now().isoformat()
+        ts_ns = _now_ns()
+        trust_name = self._trust_name
         
         # Validate checklist
-        checklist_passed = self.checklist_enforcer.validate_phase(phase, artifacts)
+        checklist_passed = self.checklist_enforcer.validate_phase(phase, artifacts, fail_fast=True)
         
         if self.yolo_mode:
             # YOLO mode: Self-approve if checklist passes
             approved = checklist_passed
             mode = 'yolo'
-            reason = "Auto-approved (YOLO mode) - checklist passed" if approved else \
-                     "Auto-rejected (YOLO mode) - checklist failed"
+            reason = _REASON_YOLO_PASS if approved else _REASON_YOLO_FAIL
         else:
             # Standard mode: Check trust level and risk
             can_auto_approve = self._check_trust_authorization(risk_level)
@@ -262,29 +484,28 @@ class GovernanceManager:
             if can_auto_approve and checklist_passed:
                 approved = True
                 mode = 'trust_based'
-                reason = f"Auto-approved - Trust level {self.trust_level.name} authorized for {risk_level} risk"
             else:
                 # Require manual approval
                 approved = False
                 mode = 'manual_required'
-                reason = f"Manual approval required - Trust level {self.trust_level.name} insufficient for {risk_level} risk or checklist failed"
+            reason = _trust_reason(trust_name, risk_level, approved)
         
         # Log the decision
-        approval_record = {
-            'timestamp': timestamp,
-            'action': action,
-            'phase': phase,
-            'approved': approved,
-            'mode': mode,
-            'reason': reason,
-            'risk_level': risk_level,
-            'trust_level': self.trust_level.name,
-            'checklist_passed': checklist_passed,
-            'yolo_mode': self.yolo_mode
-        }
-        self.approval_log.append(approval_record)
-        
-        return approval_record
+        approval_record = ApprovalRecord(
+            ts_ns=ts_ns,
+            action=action,
+            phase=phase,
+            approved=approved,
+            mode=mode,
+            reason=reason,
+            risk_level=risk_level,
+            trust_level=trust_name,
+            checklist_passed=checklist_passed,
+            yolo_mode=self.yolo_mode
+        )
+        self._log(approval_record)
+        
+        return approval_record.to_dict()
     
     def _check_trust_authorization(self, risk_level: str) -> bool:
         """
@@ -308,23 +529,24 @@ class GovernanceManager:
             True if authorized
         """
         # Map new pathways to authorization
-        if risk_level in ['streamlined', 'prototype']:
-            # Streamlined and prototype paths available at GUIDED level and above
-            return self.trust_level.value >= TrustLevel.GUIDED.value
-        
-        if risk_level == 'yolo':
-            # YOLO path requires AUTONOMOUS or higher
-            return self.trust_level.value >= TrustLevel.AUTONOMOUS.value
+        min_trust = _PATHWAY_MIN_TRUST.get(risk_level)
+        if min_trust is not None:
+            return self._trust_value >= min_trust
         
         # Backward compatibility for old risk levels
-        trust_authorizations = {
-            TrustLevel.SUPERVISED: ['minimal', 'low'],
-            TrustLevel.GUIDED: ['minimal', 'low', 'medium'],
-            TrustLevel.AUTONOMOUS: ['minimal', 'low', 'medium', 'high', 'streamlined', 'prototype'],
-            TrustLevel.TRUSTED_PARTNER: ['minimal', 'low', 'medium', 'high', 'critical', 'streamlined', 'yolo', 'prototype']
-        }
-        
-        return risk_level in trust_authorizations.get(self.trust_level, [])
+        return risk_level in _TRUST_AUTHORIZATIONS.get(self._trust_level, _NO_AUTHORIZATIONS)
+    
+    @property
+    def trust_level(self) -> TrustLevel:
+        """Current trust level of the agent."""
+        return self._trust_level
+    
+    @trust_level.setter
+    def trust_level(self, trust_level: TrustLevel):
+        # Cache the value and name read on every approval request
+        self._trust_level = trust_level
+        self._trust_value = int(trust_level)
+        self._trust_name = _TRUST_NAME[trust_level]
     
     def set_yolo_mode(self, enabled: bool):
         """
@@ -336,13 +558,13 @@ class GovernanceManager:
         previous = self.yolo_mode
         self.yolo_mode = enabled
         
-        self.approval_log.append({
-            'timestamp': datetime.now().isoformat(),
-            'action': 'yolo_mode_change',
-            'previous': previous,
-            'current': enabled,
-            'reason': 'YOLO mode toggled by user'
-        })
+        self._log(SettingChangeRecord(
+            ts_ns=_now_ns(),
+            action='yolo_mode_change',
+            previous=previous,
+            current=enabled,
+            reason='YOLO mode toggled by user'
+        ))
     
     def set_trust_level(self, trust_level: TrustLevel):
         """
@@ -354,13 +576,13 @@ class GovernanceManager:
         previous = self.trust_level
         self.trust_level = trust_level
         
-        self.approval_log.append({
-            'timestamp': datetime.now().isoformat(),
-            'action': 'trust_level_change',
-            'previous': previous.name,
-            'current': trust_level.name,
-            'reason': 'Trust level updated based on performance'
-        })
+        self._log(SettingChangeRecord(
+            ts_ns=_now_ns(),
+            action='trust_level_change',
+            previous=_TRUST_NAME[previous],
+            current=self._trust_name,
+            reason='Trust level updated based on performance'
+        ))
     
     def get_approval_history(self, limit: Optional[int] = None) -> List[Dict]:
         """
@@ -370,11 +592,15 @@ class GovernanceManager:
             limit: Maximum number of records to return (None for all)
             
         Returns:
-            List of approval records
+            List of approval records as dictionaries, oldest first
         """
         if limit:
-            return self.approval_log[-limit:]
-        return self.approval_log.copy()
+            # Walk back from the newest record so only `limit` items are visited
+            records = list(islice(reversed(self.approval_log), max(limit, 0)))
+            records.reverse()
+        else:
+            records = self.approval_log
+        return [record.to_dict() for record in records]
     
     def get_governance_status(self) -> Dict:
         """
@@ -385,7 +611,7 @@ class GovernanceManager:
         """
         return {
             'yolo_mode': self.yolo_mode,
-            'trust_level': self.trust_level.name,
+            'trust_level': self._trust_name,
             'approval_count': len(self.approval_log),
             'checklist_results': self.checklist_enforcer.validation_results
         }
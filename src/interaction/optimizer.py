@@ -4,12 +4,33 @@ Interaction Layer Module
 Implements the PromptOptimizer class that orchestrates the RJW-IDD workflow.
 This class accepts raw user input and coordinates the research → template filling flow.
 """
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from pathlib import Path
-from ..discovery.research import ResearchHarvester
-from ..utils import TemplateManager
-from ..context.engine import ContextCurator
 
+if TYPE_CHECKING:
+    from ..context.engine import ContextCurator
+    from ..discovery.research import ResearchHarvester
+    from ..utils import TemplateManager
+
+
+# Keywords that mark a research topic in user input, in reporting order
+_TOPIC_KEYWORDS = (
+    'authentication', 'authorization', 'security', 'database',
+    'API', 'testing', 'deployment', 'architecture', 'design',
+    'performance', 'scalability', 'monitoring', 'logging'
+)
+
+# Closing guidance appended to every research recommendation
+_RECOMMENDATIONS_NEXT_STEPS = """
+
+Next, you should:
+1. Review the evidence files to understand the research findings
+2. Create decision records (DEC) that reference this evidence
+3. Write specifications (SPEC) based on your decisions
+4. Implement tests (TEST) to verify the specifications
+
+Remember: In RJW-IDD, every decision and specification must be backed by evidence!
+"""
 
 class PromptOptimizer:
     """
@@ -30,6 +51,10 @@ class PromptOptimizer:
         workflow_state: Current state of the workflow
     """
     
+    __slots__ = ('research_harvester', 'template_manager', 'context_curator',
+                 'specs_output_dir', 'decisions_output_dir', 'workflow_state',
+                 '_id_counters')
+    
     def __init__(self, 
                  research_output_dir: str = "research/evidence",
                  specs_output_dir: str = "specs",
@@ -44,15 +69,21 @@ class PromptOptimizer:
             decisions_output_dir: Directory for decision files
             project_root: Root directory of project for context curation
         """
-        self.research_harvester = ResearchHarvester(research_output_dir)
-        self.template_manager = TemplateManager()
+        # Imported here so importing this module (e.g. for CLI --help) stays
+        # cheap until a workflow is actually constructed
+        from ..context.engine import ContextCurator
+        from ..discovery.research import ResearchHarvester
+        from ..utils import TemplateManager
+        
+        self.research_harvester: ResearchHarvester = ResearchHarvester(research_output_dir)
+        self.template_manager: TemplateManager = TemplateManager()
         
         # Initialize Context Curation Engine implementing METHOD-0006 framework:
         # - Section 2: Complete Context Index structure
         # - Section 3: Turn-based evaluation and relevance scoring
         # - Section 4: Context update triggers and propagation
         # - Section 5: Living Documentation integration
-        self.context_curator = ContextCurator(project_root)
+        self.context_curator: ContextCurator = ContextCurator(project_root)
         
         self.specs_output_dir = Path(specs_output_dir)
         self.decisions_output_dir = Path(decisions_output_dir)
@@ -68,6 +99,10 @@ class PromptOptimizer:
             'specifications': [],
             'context_indexes': []  # Track context indexes per METHOD-0006
         }
+        
+        # Artifact type -> (workflow_state entries covered, latest sequence
+        # number), so new DEC/SPEC IDs don't require rescanning state
+        self._id_counters: Dict[str, Tuple[int, int]] = {}
     
     def process_user_input(self, user_input: str) -> Dict:
         """
@@ -141,20 +176,9 @@ class PromptOptimizer:
         Returns:
             List of research topics
         """
-        # Simple keyword-based extraction
-        topics = []
-        
-        # Look for common patterns
-        keywords = [
-            'authentication', 'authorization', 'security', 'database',
-            'API', 'testing', 'deployment', 'architecture', 'design',
-            'performance', 'scalability', 'monitoring', 'logging'
-        ]
-        
+        # Simple keyword-based extraction: look for common patterns
         user_input_lower = user_input.lower()
-        for keyword in keywords:
-            if keyword in user_input_lower:
-                topics.append(keyword)
+        topics = [keyword for keyword in _TOPIC_KEYWORDS if keyword in user_input_lower]
         
         # If no specific topics found, use the full input as a general topic
         if not topics:
@@ -228,20 +252,13 @@ class PromptOptimizer:
         Returns:
             Recommendation text
         """
-        return f"""
-Based on your request: "{user_input[:100]}..."
-
-Evidence has been gathered and documented in:
-{chr(10).join([f'  - {evd_id}' for evd_id in evidence_ids])}
-
-Next, you should:
-1. Review the evidence files to understand the research findings
-2. Create decision records (DEC) that reference this evidence
-3. Write specifications (SPEC) based on your decisions
-4. Implement tests (TEST) to verify the specifications
-
-Remember: In RJW-IDD, every decision and specification must be backed by evidence!
-"""
+        parts = [
+            '\nBased on your request: "', user_input[:100], '..."\n\n'
+            'Evidence has been gathered and documented in:\n',
+            '\n'.join([f'  - {evd_id}' for evd_id in evidence_ids]),
+            _RECOMMENDATIONS_NEXT_STEPS,
+        ]
+        return ''.join(parts)
     
     def create_decision_with_evidence(self, 
                                      decision_title: str,
@@ -271,8 +288,7 @@ Remember: In RJW-IDD, every decision and specification must be backed by evidenc
         self.research_harvester.require_evidence_for_artifact('DEC', evidence_refs)
         
         # Generate decision ID
-        existing_decs = [d['id'] for d in self.workflow_state['decisions']]
-        dec_id = self.template_manager.generate_artifact_id('DEC', existing_decs)
+        dec_id = self._next_artifact_id('DEC', self.workflow_state['decisions'])
         
         # Store decision metadata
         decision_data = {
@@ -313,8 +329,7 @@ Remember: In RJW-IDD, every decision and specification must be backed by evidenc
         self.research_harvester.require_evidence_for_artifact('SPEC', evidence_refs)
         
         # Generate spec ID
-        existing_specs = [s['id'] for s in self.workflow_state['specifications']]
-        spec_id = self.template_manager.generate_artifact_id('SPEC', existing_specs)
+        spec_id = self._next_artifact_id('SPEC', self.workflow_state['specifications'])
         
         # Store spec metadata
         spec_data = {
@@ -328,6 +343,32 @@ Remember: In RJW-IDD, every decision and specification must be backed by evidenc
         
         return spec_id
     
+    def _next_artifact_id(self, artifact_type: str, entries: List[Dict]) -> str:
+        """
+        Allocate the next ID for a decision or specification.
+        
+        Args:
+            artifact_type: Type of artifact ('DEC' or 'SPEC')
+            entries: The workflow_state list the new artifact will be added to
+            
+        Returns:
+            Next available ID (e.g., 'DEC-0001')
+        """
+        covered, number = self._id_counters.get(artifact_type, (0, 0))
+        
+        # Entries added or replaced outside this method leave the counter
+        # behind; reseed it from the IDs already in the workflow state
+        if covered != len(entries) or (
+            entries and entries[-1]['id'] != self.template_manager.format_artifact_id(artifact_type, number)
+        ):
+            number = self.template_manager.max_artifact_number(
+                artifact_type, [entry['id'] for entry in entries]
+            )
+        
+        number += 1
+        self._id_counters[artifact_type] = (len(entries) + 1, number)
+        return self.template_manager.format_artifact_id(artifact_type, number)
+    
     def get_workflow_summary(self) -> Dict:
         """
         Get a summary of the current workflow state.
@@ -12,6 +12,15 @@ from enum import Enum
 import re
 
 
+# Patterns for identifying artifact files, compiled once at import
+_ARTIFACT_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    'evidence': re.compile(r'EVD-\d{4}'),
+    'spec': re.compile(r'SPEC-\d{4}'),
+    'test': re.compile(r'TEST-\d{4}'),
+    'decision': re.compile(r'DEC-\d{4}')
+}
+
+
 class OperationType(Enum):
     """Types of file operations."""
     READ = "read"
@@ -220,13 +229,24 @@ class SystemGuard:
         self.operation_log: List[Dict] = []
         self.strict_mode = strict_mode
         
-        # Patterns for identifying artifact files
-        self.artifact_patterns = {
-            'evidence': r'EVD-\d{4}',
-            'spec': r'SPEC-\d{4}',
-            'test': r'TEST-\d{4}',
-            'decision': r'DEC-\d{4}'
-        }
+        # Compiled patterns for identifying artifact files
+        self.artifact_patterns = dict(_ARTIFACT_PATTERNS)
+    
+    def classify_artifact(self, file_path: str) -> Optional[str]:
+        """
+        Identify which kind of artifact a file is from its name.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Artifact kind ('evidence', 'spec', 'test', 'decision') or None
+        """
+        name = os.path.basename(file_path)
+        for kind, pattern in self.artifact_patterns.items():
+            if pattern.search(name):
+                return kind
+        return None
     
     def register_evidence(self, evd_id: str, file_path: str):
         """
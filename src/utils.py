@@ -1,11 +1,119 @@
 """
 Utility functions for the RJW-IDD agent framework.
 """
+import json
 import os
 import re
-from datetime import datetime
+import sys
+from collections import abc
+from datetime import date, datetime, time
+from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+# Try to import orjson for faster serialization (optional dependency)
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library encoder
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Encode types the JSON encoders don't handle directly.
+    
+    Read-only mappings (e.g. MappingProxyType views) become objects. Dates,
+    times and enums are encoded the way orjson encodes them natively, so
+    both backends of _json_dumps produce the same bytes.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Reused across calls so the encoder isn't rebuilt per serialization; UTF-8
+# output and stringified non-str keys match orjson with OPT_NON_STR_KEYS
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=_json_default)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+# Slotted dataclasses (no per-instance __dict__) where the runtime supports them
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class _RecordMapping(abc.Mapping):
+    """
+    Read-only mapping view shared by slotted dataclass records.
+    
+    A record reads as the plain dictionary built by _build_dict(): its
+    dataclass fields in declaration order, minus any named in
+    ``_hidden_fields`` and any still set to None. Subclasses extend
+    _build_dict() to add derived keys.
+    """
+    __slots__ = ()
+    
+    _hidden_fields: FrozenSet[str] = frozenset()
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the dictionary this record reads as."""
+        hidden = self._hidden_fields
+        built = {}
+        for name in self.__dataclass_fields__:
+            if name not in hidden:
+                value = getattr(self, name)
+                if value is not None:
+                    built[name] = value
+        return built
+    
+    def _as_dict(self) -> Dict[str, Any]:
+        """Dictionary backing the mapping view; override to cache it."""
+        return self._build_dict()
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._as_dict()[key]
+    
+    def __iter__(self):
+        return iter(self._as_dict())
+    
+    def __len__(self) -> int:
+        return len(self._as_dict())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a new plain dictionary."""
+        return dict(self._as_dict())
+
+# Artifact ID anywhere in a filename (e.g. 'EVD-0001')
+_ARTIFACT_ID_RE = re.compile(r'(EVD|DEC|SPEC|REQ|TEST|CTX)-\d{4}')
+
+# Placeholder blocks in the evidence template that fill_evidence_template replaces
+_EVIDENCE_SUMMARY_PLACEHOLDER = '## Summary\n\nBrief description of the evidence and its key insights.'
+_EVIDENCE_INSIGHTS_PLACEHOLDER = (
+    '## Key Insights\n\n'
+    '1. First major insight or finding.\n'
+    '2. Second major insight or finding.\n'
+    '3. Third major insight or finding.'
+)
+_EVIDENCE_PLACEHOLDER_RE = re.compile('|'.join(re.escape(placeholder) for placeholder in (
+    '# EVD-XXXX — Evidence Title',
+    '**Harvested:** YYYY-MM-DD',
+    '**Curator:** Role/Name',
+    '**Status:** Raw | Curated | Promoted | Archived',
+    '- **Source Type:** Forum | GitHub | Publication | Interview | Survey | Analytics',
+    '- **Source URL:** Link to original source',
+    '- **Source Date:** YYYY-MM-DD',
+    _EVIDENCE_SUMMARY_PLACEHOLDER,
+    _EVIDENCE_INSIGHTS_PLACEHOLDER,
+)))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+    return _JSON_ENCODER.encode(obj).encode('utf-8')
 
 
 class TemplateManager:
@@ -33,17 +141,30 @@ class TemplateManager:
         self.templates_dir = Path(templates_dir)
         if not self.templates_dir.exists():
             raise ValueError(f"Templates directory not found: {self.templates_dir}")
+        
+        # Compiled '<TYPE>-<number>' pattern per artifact type
+        self._id_patterns: Dict[str, re.Pattern] = {}
+        
+        # Template contents by template type, read from disk on first use
+        self._template_cache: Dict[str, str] = {}
     
     def load_template(self, template_type: str) -> str:
         """
         Load a template file.
         
+        Each template is read from disk once per TemplateManager and served
+        from memory afterwards.
+        
         Args:
             template_type: Type of template (e.g., 'evidence', 'decision', 'spec')
             
         Returns:
             Template content as string
         """
+        cached = self._template_cache.get(template_type)
+        if cached is not None:
+            return cached
+        
         template_map = {
             'evidence': 'evidence/EVD-template.md',
             'decision': 'decisions/DEC-template.md',
@@ -59,7 +180,10 @@ class TemplateManager:
             raise FileNotFoundError(f"Template not found: {template_path}")
         
         with open(template_path, 'r', encoding='utf-8') as f:
-            return f.read()
+            content = f.read()
+        
+        self._template_cache[template_type] = content
+        return content
     
     def generate_artifact_id(self, artifact_type: str, existing_ids: list = None) -> str:
         """
@@ -72,20 +196,50 @@ class TemplateManager:
         Returns:
             Next available ID (e.g., 'EVD-0001')
         """
+        return self.format_artifact_id(artifact_type, self.max_artifact_number(artifact_type, existing_ids) + 1)
+    
+    def max_artifact_number(self, artifact_type: str, existing_ids: list = None) -> int:
+        """
+        Find the highest sequence number among existing artifact IDs.
+        
+        Args:
+            artifact_type: Type of artifact (EVD, DEC, SPEC, etc.)
+            existing_ids: List of existing IDs to scan
+            
+        Returns:
+            Highest sequence number of that type, or 0 if there is none
+        """
         if existing_ids is None:
             existing_ids = []
         
         # Extract numbers from existing IDs
+        pattern = self._id_patterns.get(artifact_type)
+        if pattern is None:
+            pattern = self._id_patterns[artifact_type] = re.compile(rf"{artifact_type}-(\d+)")
+        
         numbers = []
-        pattern = rf"{artifact_type}-(\d+)"
         for aid in existing_ids:
-            match = re.match(pattern, aid)
+            match = pattern.match(aid)
             if match:
                 numbers.append(int(match.group(1)))
         
-        # Get next number
-        next_num = max(numbers) + 1 if numbers else 1
-        return f"{artifact_type}-{next_num:04d}"
+        return max(numbers) if numbers else 0
+    
+    def format_artifact_id(self, artifact_type: str, number: int) -> str:
+        """
+        Format an artifact ID from its type and sequence number.
+        
+        Callers that track the latest sequence number themselves can use this
+        instead of generate_artifact_id to avoid rescanning existing IDs.
+        
+        Args:
+            artifact_type: Type of artifact (EVD, DEC, SPEC, etc.)
+            number: Sequence number of the artifact
+            
+        Returns:
+            Formatted ID (e.g., 'EVD-0001')
+        """
+        return f"{artifact_type}-{number:04d}"
     
     def fill_evidence_template(self, 
                                evidence_id: str,
@@ -113,35 +267,23 @@ class TemplateManager:
             Filled template content
         """
         template = self.load_template('evidence')
-        
-        # Replace placeholders
         date = datetime.now().strftime('%Y-%m-%d')
+        insights_text = '\n'.join([f'{i}. {insight}' for i, insight in enumerate(key_insights, 1)])
         
-        content = template.replace('# EVD-XXXX — Evidence Title', f'# {evidence_id} — {title}')
-        content = content.replace('**Harvested:** YYYY-MM-DD', f'**Harvested:** {date}')
-        content = content.replace('**Curator:** Role/Name', f'**Curator:** {curator}')
-        content = content.replace('**Status:** Raw | Curated | Promoted | Archived', '**Status:** Curated')
-        content = content.replace('- **Source Type:** Forum | GitHub | Publication | Interview | Survey | Analytics', 
-                                  f'- **Source Type:** {source_type}')
-        content = content.replace('- **Source URL:** Link to original source', f'- **Source URL:** {source_url}')
-        content = content.replace('- **Source Date:** YYYY-MM-DD', f'- **Source Date:** {date}')
-        
-        # Replace summary
-        content = re.sub(
-            r'## Summary\n\nBrief description of the evidence and its key insights\.',
-            f'## Summary\n\n{summary}',
-            content
-        )
-        
-        # Replace key insights
-        insights_text = '\n'.join([f'{i+1}. {insight}' for i, insight in enumerate(key_insights)])
-        content = re.sub(
-            r'## Key Insights\n\n1\. First major insight or finding\.\n2\. Second major insight or finding\.\n3\. Third major insight or finding\.',
-            f'## Key Insights\n\n{insights_text}',
-            content
-        )
-        
-        return content
+        # Replacement for each placeholder block, filled in one pass over the template
+        replacements = {
+            '# EVD-XXXX — Evidence Title': f'# {evidence_id} — {title}',
+            '**Harvested:** YYYY-MM-DD': f'**Harvested:** {date}',
+            '**Curator:** Role/Name': f'**Curator:** {curator}',
+            '**Status:** Raw | Curated | Promoted | Archived': '**Status:** Curated',
+            '- **Source Type:** Forum | GitHub | Publication | Interview | Survey | Analytics':
+                f'- **Source Type:** {source_type}',
+            '- **Source URL:** Link to original source': f'- **Source URL:** {source_url}',
+            '- **Source Date:** YYYY-MM-DD': f'- **Source Date:** {date}',
+            _EVIDENCE_SUMMARY_PLACEHOLDER: f'## Summary\n\n{summary}',
+            _EVIDENCE_INSIGHTS_PLACEHOLDER: f'## Key Insights\n\n{insights_text}',
+        }
+        return _EVIDENCE_PLACEHOLDER_RE.sub(lambda match: replacements[match.group(0)], template)
     
     def save_artifact(self, content: str, output_path: str) -> str:
         """
@@ -173,6 +315,5 @@ def get_artifact_id_from_filename(filename: str) -> Optional[str]:
     Returns:
         Artifact ID if found, None otherwise
     """
-    pattern = r'(EVD|DEC|SPEC|REQ|TEST|CTX)-\d{4}'
-    match = re.search(pattern, filename)
+    match = _ARTIFACT_ID_RE.search(filename)
     return match.group(0) if match else None
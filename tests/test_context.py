@@ -1,9 +1,13 @@
 """Tests for the Context Engine module."""
+import json
 import pytest
+from datetime import datetime, timezone
+from dataclasses import fields
 import tempfile
 import shutil
 from pathlib import Path
-from src.context.engine import ContextCurator, ASTAnalyzer, DependencyGraph, CodeElement
+from src.context.engine import ContextCurator, ContextIndex, ASTAnalyzer, DependencyGraph, CodeElement
+from src.utils import _json_dumps
 
 
 class TestASTAnalyzer:
@@ -61,6 +65,32 @@ def my_function(arg1, arg2):
         """Test analyzing a non-existent file."""
         elements = analyzer.analyze_file("/nonexistent/file.py")
         assert elements == []
+    
+    def test_analyze_file_matches_ast_walk_order(self, analyzer, temp_dir):
+        """Test that elements are reported in ast.walk (breadth-first) order."""
+        import ast
+        
+        test_file = Path(temp_dir) / "test_order.py"
+        test_file.write_text('''
+class Outer:
+    def method(self):
+        def inner():
+            pass
+
+def helper():
+    pass
+
+class Second:
+    pass
+''')
+        
+        elements = analyzer.analyze_file(str(test_file))
+        
+        expected = [
+            node.name for node in ast.walk(ast.parse(test_file.read_text()))
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef))
+        ]
+        assert [e.name for e in elements] == expected == ['Outer', 'helper', 'Second', 'method', 'inner']
 
 
 class TestDependencyGraph:
@@ -133,6 +163,15 @@ class TestDependencyGraph:
         # Find nodes related to "Auth"
         related = graph.find_related("Auth")
         assert len(related) >= 2
+    
+    def test_find_by_name(self, graph):
+        """Test exact-name lookup of nodes."""
+        id1 = graph.add_node(CodeElement("Auth", "class", "/test/auth.py", 1, 10))
+        id2 = graph.add_node(CodeElement("Auth", "function", "/test/other.py", 1, 5))
+        graph.add_node(CodeElement("AuthHelper", "class", "/test/helper.py", 1, 10))
+        
+        assert graph.find_by_name("Auth") == {id1, id2}
+        assert graph.find_by_name("Missing") == set()
 
 
 class TestContextCurator:
@@ -172,6 +211,24 @@ def my_function():
         assert stats['files_analyzed'] > 0
         assert stats['total_elements'] > 0
     
+    def test_scan_project_resolves_forward_references(self, temp_dir):
+        """Test that edges resolve regardless of file traversal order."""
+        (Path(temp_dir) / "a_user.py").write_text('''
+def use_helper():
+    return z_helper()
+''')
+        (Path(temp_dir) / "z_defs.py").write_text('''
+def z_helper():
+    return 1
+''')
+        
+        curator = ContextCurator(temp_dir)
+        graph = curator.dependency_graph
+        user_id = next(nid for nid in graph.nodes if nid.endswith("::use_helper"))
+        helper_id = next(nid for nid in graph.nodes if nid.endswith("::z_helper"))
+        
+        assert helper_id in graph.edges[user_id]
+    
     def test_find_related_code(self, curator):
         """Test finding related code."""
         related = curator.find_related_code("MyClass")
@@ -212,6 +269,17 @@ def my_function():
         assert len(context['focus_areas']) == 2
         assert len(context['related_files']) > 0
     
+    def test_get_context_json(self, curator):
+        """Test JSON serialization of a context index."""
+        ctx_id = curator.build_context_index(
+            task_id="TASK-JSON",
+            focus_areas=["MyClass"]
+        )
+        
+        data = json.loads(curator.get_context_json(ctx_id))
+        assert data == curator.get_context(ctx_id)
+        assert curator.get_context_json("CTX-MISSING") is None
+    
     def test_slice_code(self, curator, temp_dir):
         """Test slicing code from a file."""
         test_file = Path(temp_dir) / "module1.py"
@@ -231,6 +299,23 @@ def my_function():
         assert 'total_elements' in stats
         assert stats['total_elements'] > 0
     
+    def test_get_project_structure_matches_graph(self, curator):
+        """Test that incremental counters agree with the graph contents."""
+        nodes = curator.dependency_graph.nodes.values()
+        stats = curator.get_project_structure()
+        
+        assert stats['files_analyzed'] == len({n.file_path for n in nodes})
+        assert stats['classes'] == sum(1 for n in nodes if n.type == 'class')
+        assert stats['functions'] == sum(1 for n in nodes if n.type == 'function')
+    
+    def test_initial_relevance_dependency_match(self, curator):
+        """Test that dependency relevance requires an exact name match."""
+        element = CodeElement("Runner", "class", "/test/run.py", 1, 10)
+        element.dependencies.update({"AuthHelper", "logger"})
+        
+        assert curator._calculate_initial_relevance(element, ["authhelper"]) == 0.6
+        assert curator._calculate_initial_relevance(element, ["helper"]) == 0.4
+    
     def test_evaluate_context_on_turn(self, curator):
         """Test turn-based context evaluation per METHOD-0006 Section 3.1."""
         # Create a context index with items
@@ -293,6 +378,22 @@ def my_function():
             assert curator.score_context_item(ctx_id, item_id, 0.0) is True
             assert curator.score_context_item(ctx_id, item_id, 1.0) is True
     
+    def test_get_top_context_items(self, curator):
+        """Test top-k retrieval by relevance score."""
+        ctx_id = curator.build_context_index(
+            task_id="TASK-TOPK",
+            focus_areas=["MyClass", "my_function"]
+        )
+        ctx_index = curator.context_indexes[ctx_id]
+        for score, item in zip((0.3, 0.9, 0.6), ctx_index.context_items):
+            item.relevance_score = score
+        
+        top = curator.get_top_context_items(ctx_id, 2)
+        scores = sorted((i.relevance_score for i in ctx_index.context_items), reverse=True)
+        
+        assert [i.relevance_score for i in top] == scores[:2]
+        assert curator.get_top_context_items("CTX-MISSING", 2) == []
+    
     def test_update_context_on_change(self, curator):
         """Test context updates on changes per METHOD-0006 Section 4."""
         # Create a context index
@@ -357,6 +458,38 @@ def my_function():
         assert ctx_id1 in updated_contexts
         assert ctx_id2 in updated_contexts
     
+    def test_propagate_update_returns_creation_order(self, curator):
+        """Test propagation visits affected contexts in creation order."""
+        ctx_ids = [
+            curator.build_context_index(
+                task_id=f"TASK-02{i}",
+                focus_areas=["MyClass"],
+                decision_refs=['DEC-0002']
+            )
+            for i in range(5)
+        ]
+        # Rebuilding an index keeps its original position
+        curator.build_context_index(
+            task_id="TASK-020", focus_areas=["MyClass"], decision_refs=['DEC-0002']
+        )
+        
+        assert curator.propagate_update('decision', 'DEC-0002') == ctx_ids
+    
+    def test_propagate_update_tracks_changes(self, curator):
+        """Test propagation follows refs added after the index was built."""
+        ctx_id = curator.build_context_index(
+            task_id="TASK-013",
+            focus_areas=["MyClass"]
+        )
+        assert curator.propagate_update('spec', 'SPEC-0042') == []
+        
+        curator.update_context_on_change(ctx_id, 'spec', 'Linked spec', ['SPEC-0042'])
+        assert curator.propagate_update('spec', 'SPEC-0042') == [ctx_id]
+        
+        # Rebuilding the index drops refs the new index no longer has
+        curator.build_context_index(task_id="TASK-013", focus_areas=["MyClass"])
+        assert curator.propagate_update('spec', 'SPEC-0042') == []
+    
     def test_living_documentation(self, curator):
         """Test Living Documentation integration per METHOD-0006 Section 5."""
         # Load living docs
@@ -375,6 +508,77 @@ def my_function():
         # Test non-existent category
         assert curator.get_living_docs_context('nonexistent') is None
     
+    def test_living_documentation_is_frozen(self, curator):
+        """Test that loaded Living Documentation is read-only."""
+        living_docs = {'rules': {'required': ['tests', 'review']}}
+        curator.load_living_documentation(living_docs)
+        
+        rules = curator.get_living_docs_context('rules')
+        assert rules['required'] == ('tests', 'review')
+        with pytest.raises(TypeError):
+            rules['required'] = ()
+        
+        # Updates go through update_living_docs and keep other categories
+        curator.update_living_docs({'conventions': {'style': 'PEP 8'}})
+        assert curator.get_living_docs_context('conventions')['style'] == 'PEP 8'
+        assert curator.get_living_docs_context('rules') is rules
+    
+    def test_living_documentation_export_is_plain(self, curator):
+        """Test that exported Living Documentation serializes with json.dumps."""
+        living_docs = {'rules': {'required': ['tests', 'review']}}
+        curator.load_living_documentation(living_docs)
+        
+        exported = curator.export_living_docs()
+        assert exported == living_docs
+        assert json.loads(json.dumps(exported)) == living_docs
+        
+        # The shared JSON helper also accepts the frozen view directly
+        assert json.loads(_json_dumps(curator.living_docs)) == living_docs
+        
+        # The export is an independent copy
+        exported['rules']['required'].append('docs')
+        assert curator.get_living_docs_context('rules')['required'] == ('tests', 'review')
+    
+    def test_json_helper_fallback_matches_orjson(self, monkeypatch):
+        """Test that the standard library fallback emits the same bytes as orjson."""
+        import src.utils as utils
+        from types import MappingProxyType
+        
+        payload = {
+            'title': 'Café ☕',
+            'when': datetime(2024, 1, 2, 3, 4, 5, 600, tzinfo=timezone.utc),
+            1: MappingProxyType({'refs': ('DEC-0001', None)}),
+        }
+        expected = '{"title":"Café ☕","when":"2024-01-02T03:04:05.000600+00:00","1":{"refs":["DEC-0001",null]}}'.encode('utf-8')
+        
+        default_output = _json_dumps(payload)
+        monkeypatch.setattr(utils, 'orjson', None)
+        assert _json_dumps(payload) == expected
+        assert default_output == expected
+    
+    def test_living_docs_assignment_is_frozen(self, curator):
+        """Test that assigning living_docs directly stores a frozen copy."""
+        assert curator.get_living_docs_context('conventions') is None
+        curator.living_docs = {'conventions': {'style': ['PEP 8']}}
+        
+        conventions = curator.get_living_docs_context('conventions')
+        assert conventions['style'] == ('PEP 8',)
+        with pytest.raises(TypeError):
+            conventions['style'] = ()
+        
+        # Clearing by assignment is seen by lookups too
+        curator.living_docs = {}
+        assert curator.get_living_docs_context('conventions') is None
+    
+    def test_living_documentation_from_file(self, curator, temp_dir):
+        """Test loading Living Documentation from a JSON file."""
+        docs_file = Path(temp_dir) / "living_docs.json"
+        docs_file.write_text(json.dumps({'technologies': {'languages': ['python']}}))
+        
+        curator.load_living_documentation(docs_file)
+        
+        assert curator.get_living_docs_context('technologies')['languages'] == ('python',)
+    
     def test_add_assumption(self, curator):
         """Test adding assumptions per METHOD-0006 Section 2.2."""
         ctx_id = curator.build_context_index(
@@ -393,6 +597,40 @@ def my_function():
         curator.add_assumption(ctx_id, "API may need rate limiting", provisional=True)
         assert "API may need rate limiting" in ctx_index.provisional_assumptions
     
+    def test_add_assumption_updates_timestamp(self, curator):
+        """Test that last_updated reflects add_* writes when read."""
+        ctx_id = curator.build_context_index(
+            task_id="TASK-018",
+            focus_areas=["MyClass"]
+        )
+        built_at = curator.get_last_updated(ctx_id)
+        
+        curator.add_assumption(ctx_id, "Cache is warm")
+        
+        assert curator.get_last_updated(ctx_id) >= built_at
+        assert curator.get_context(ctx_id)['last_updated'] == curator.get_last_updated(ctx_id).isoformat()
+        assert curator.get_last_updated("CTX-MISSING") is None
+    
+    def test_last_updated_attribute_tracks_writes(self, curator):
+        """Test that reading ContextIndex.last_updated directly is never stale."""
+        ctx_id = curator.build_context_index(task_id="TASK-019", focus_areas=["MyClass"])
+        ctx_index = curator.context_indexes[ctx_id]
+        ctx_index.last_updated = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        
+        curator.add_dependency(ctx_id, 'upstream', 'TASK-001')
+        
+        assert ctx_index.last_updated.year > 2000
+        assert ctx_index.last_updated == curator.get_last_updated(ctx_id)
+    
+    def test_context_index_accepts_last_updated(self):
+        """Test that last_updated stays a public ContextIndex field."""
+        stamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        ctx_index = ContextIndex(ctx_id="CTX-X", task_id="TASK-X", last_updated=stamp)
+        
+        assert ctx_index.last_updated == stamp
+        assert 'last_updated' in {f.name for f in fields(ContextIndex)}
+        assert '_pending_update' not in {f.name for f in fields(ContextIndex)}
+    
     def test_add_dependency(self, curator):
         """Test adding dependencies per METHOD-0006 Section 2.2."""
         ctx_id = curator.build_context_index(
@@ -417,3 +655,74 @@ def my_function():
         
         # Test invalid dependency type
         assert curator.add_dependency(ctx_id, 'invalid', 'TASK-013') is False
+        
+        # Duplicate dependencies are not recorded twice
+        assert curator.add_dependency(ctx_id, 'upstream', 'TASK-001') is True
+        assert ctx_index.upstream_tasks.count('TASK-001') == 1
+    
+    def test_add_bulk(self, curator):
+        """Test bulk assumption and dependency updates."""
+        ctx_id = curator.build_context_index(
+            task_id="TASK-014",
+            focus_areas=["MyClass"]
+        )
+        
+        assert curator.add_assumptions_bulk(ctx_id, ["A1", "A2"]) is True
+        assert curator.add_assumptions_bulk(ctx_id, ["P1"], provisional=True) is True
+        assert curator.add_dependencies_bulk(ctx_id, 'upstream', ["TASK-001", "TASK-002", "TASK-001"]) is True
+        
+        ctx_index = curator.context_indexes[ctx_id]
+        assert ctx_index.assumptions == ["A1", "A2"]
+        assert ctx_index.provisional_assumptions == ["P1"]
+        assert ctx_index.upstream_tasks == ["TASK-001", "TASK-002"]
+        
+        # Non-string refs are accepted as given
+        assert curator.add_dependencies_bulk(ctx_id, 'parallel', ["TASK-004", 5]) is True
+        assert ctx_index.parallel_work == ["TASK-004", 5]
+        
+        assert curator.add_dependencies_bulk(ctx_id, 'invalid', ["TASK-003"]) is False
+        assert curator.add_assumptions_bulk("CTX-MISSING", ["A3"]) is False
+    
+    def test_add_dependency_by_idx(self, curator):
+        """Test dependency updates through resolved integer handles."""
+        ctx_id = curator.build_context_index(
+            task_id="TASK-015",
+            focus_areas=["MyClass"]
+        )
+        idx = curator.resolve_ctx(ctx_id)
+        
+        assert idx is not None
+        assert curator.add_dependency_by_idx(idx, 'downstream', 'TASK-016') is True
+        assert 'TASK-016' in curator.context_indexes[ctx_id].downstream_tasks
+        
+        # Rebuilding the index keeps the handle
+        curator.build_context_index(task_id="TASK-015", focus_areas=["MyClass"])
+        assert curator.resolve_ctx(ctx_id) == idx
+        
+        assert curator.resolve_ctx("CTX-MISSING") is None
+        assert curator.add_dependency_by_idx(idx + 100, 'upstream', 'TASK-017') is False
+    
+    def test_updates_after_rebuild_target_current_index(self, curator):
+        """Test that single and bulk updates all reach the rebuilt index."""
+        ctx_id = curator.build_context_index(task_id="TASK-017", focus_areas=["MyClass"])
+        curator.build_context_index(task_id="TASK-017", focus_areas=["MyClass"])
+        
+        assert curator.add_assumption(ctx_id, "A1") is True
+        assert curator.add_assumptions_bulk(ctx_id, ["A2"]) is True
+        assert curator.add_dependency(ctx_id, 'upstream', 'TASK-001') is True
+        assert curator.add_dependencies_bulk(ctx_id, 'upstream', ['TASK-002']) is True
+        
+        ctx_index = curator.context_indexes[ctx_id]
+        assert ctx_index.assumptions == ["A1", "A2"]
+        assert ctx_index.upstream_tasks == ["TASK-001", "TASK-002"]
+        
+        assert curator.add_assumption("CTX-MISSING", "A3") is False
+        assert curator.add_dependency("CTX-MISSING", 'upstream', 'TASK-003') is False
+    
+    def test_propagate_update_sees_directly_edited_refs(self, curator):
+        """Test that refs appended to the public lists still propagate."""
+        ctx_id = curator.build_context_index(task_id="T1", focus_areas=["MyClass"])
+        curator.context_indexes[ctx_id].decision_refs.append('DEC-9')
+        
+        assert curator.propagate_update('decision', 'DEC-9') == [ctx_id]
+        assert curator.propagate_update('unknown', 'DEC-9') == []
@@ -39,6 +39,38 @@ class TestResearchHarvester:
         # Check that evidence is registered
         assert evd_id in harvester.evidence_registry
     
+    def test_harvest_topic_with_backslashes(self, harvester, temp_dir):
+        """Test that template values are inserted literally."""
+        topic = r"paths like C:\data\new"
+        evd_id = harvester.harvest(topic=topic)
+        
+        content = (Path(temp_dir) / f"{evd_id}.md").read_text(encoding='utf-8')
+        assert f"Comprehensive research conducted on '{topic}'" in content
+        assert f"1. Industry best practices for {topic}" in content
+    
+    def test_template_read_once_per_harvester(self, temp_dir):
+        """Test that later harvests reuse the already-loaded template."""
+        templates = Path(temp_dir) / "templates"
+        shutil.copytree(Path(__file__).parent.parent / "rjw-idd-methodology" / "templates", templates)
+        harvester = ResearchHarvester(output_dir=str(Path(temp_dir) / "out"),
+                                      templates_dir=str(templates))
+        
+        first = harvester.harvest(topic="caching")
+        (templates / "evidence" / "EVD-template.md").unlink()
+        second = harvester.harvest(topic="caching")
+        
+        assert first != second
+    
+    def test_templates_loaded_only_when_harvesting(self, temp_dir):
+        """Test that lookups work without a valid templates directory."""
+        missing = str(Path(temp_dir) / "no-templates")
+        harvester = ResearchHarvester(output_dir=temp_dir, templates_dir=missing)
+        
+        assert harvester.list_evidence() == []
+        assert harvester.validate_evidence_exists("EVD-0001") is False
+        with pytest.raises(ValueError, match="Templates directory not found"):
+            harvester.harvest(topic="caching")
+    
     def test_harvest_increments_id(self, harvester):
         """Test that harvest generates sequential IDs."""
         evd_id1 = harvester.harvest(topic="topic1")
@@ -105,6 +137,31 @@ class TestResearchHarvester:
         # Non-existent evidence
         assert harvester.get_evidence("EVD-9999") is None
     
+    def test_registry_records_loaded_evidence_path_only(self, temp_dir):
+        """Test that evidence found on disk is registered without a topic."""
+        (Path(temp_dir) / "EVD-0001.md").write_text("# EVD-0001")
+        
+        harvester = ResearchHarvester(output_dir=temp_dir)
+        record = harvester.evidence_registry["EVD-0001"]
+        assert record.topic is None
+        assert harvester.get_evidence("EVD-0001") == {
+            'path': str(Path(temp_dir) / "EVD-0001.md"),
+        }
+        assert harvester.list_evidence(topic_filter="anything") == []
+    
+    def test_registry_records_read_as_mappings(self, harvester):
+        """Test that registry entries expose only the keys that were set."""
+        evd_id = harvester.harvest(topic="test topic", source_url="http://example.com")
+        record = harvester.evidence_registry[evd_id]
+        
+        assert set(record) == {'path', 'topic', 'created', 'source_type', 'source_url'}
+        assert 'topic' in record
+        assert 'user_provided' not in record
+        assert record.get('curator', 'n/a') == 'n/a'
+        assert dict(record) == harvester.get_evidence(evd_id)
+        with pytest.raises(KeyError):
+            record['user_priority']
+    
     def test_require_evidence_user_requirement_exception(self, harvester):
         """Test that user requirements don't require evidence."""
         # User requirements should NOT require evidence
@@ -124,6 +181,31 @@ class TestResearchHarvester:
                 [],  # No evidence refs
                 is_user_requirement=False
             )
+    
+    def test_harvest_continues_numbering_from_existing_files(self, temp_dir):
+        """Test that new IDs follow the highest EVD file already on disk."""
+        (Path(temp_dir) / "EVD-0007.md").write_text("# EVD-0007")
+        (Path(temp_dir) / "EVD-0002.md").write_text("# EVD-0002")
+        
+        harvester = ResearchHarvester(output_dir=temp_dir)
+        assert harvester.harvest(topic="caching") == "EVD-0008"
+        assert harvester.harvest_user_research("Users want faster page loads") == "EVD-0009"
+    
+    def test_harvest_skips_ids_written_after_scan(self, harvester, temp_dir):
+        """Test that EVD files created by someone else are never overwritten."""
+        (Path(temp_dir) / "EVD-0001.md").write_text("# EVD-0001 (external)")
+        
+        assert harvester.harvest(topic="caching") == "EVD-0002"
+        assert (Path(temp_dir) / "EVD-0001.md").read_text() == "# EVD-0001 (external)"
+        assert harvester.validate_evidence_exists("EVD-0001")
+    
+    def test_failed_write_does_not_use_up_id(self, harvester, temp_dir):
+        """Test that an evidence ID is only consumed once its file is written."""
+        with pytest.raises(TypeError):
+            harvester._write_evidence(lambda evd_id: None)
+        
+        assert not (Path(temp_dir) / "EVD-0001.md").exists()
+        assert harvester.harvest(topic="caching") == "EVD-0001"
 
 
 class TestUserEvidenceParser:
@@ -283,3 +365,69 @@ Key findings from load testing:
         
         assert harvester.evidence_registry[evd_id]['user_priority'] is True
         assert harvester.evidence_registry[evd_id]['curator'] == "Security Team"
+    
+    def test_parse_sections_single_pass(self, parser):
+        """Test that every section is picked up from one scan of the input."""
+        raw_input = """
+# Caching Study
+
+## Overview
+Overview of the caching experiment.
+
+## Approach
+Replayed production traffic against a staging cluster.
+
+## Recommendations
+Enable the read-through cache for session lookups.
+        """
+        
+        parsed = parser.parse_user_research(raw_input)
+        assert parsed['summary'] == 'Overview of the caching experiment.'
+        assert parsed['methodology'] == 'Replayed production traffic against a staging cluster.'
+        assert parsed['conclusions'] == 'Enable the read-through cache for session lookups.'
+    
+    def test_parse_mixed_lists_bullets_before_numbered(self, parser):
+        """Test that bullet items are listed ahead of numbered items."""
+        raw_input = """
+1. Numbered finding about latency
+- Bulleted finding about throughput
+2. Numbered finding about memory use
+        """
+        
+        parsed = parser.parse_user_research(raw_input)
+        assert parsed['key_insights'][:3] == [
+            'Bulleted finding about throughput',
+            'Numbered finding about latency',
+            'Numbered finding about memory use',
+        ]
+    
+    def test_harvest_user_research_reuses_parser(self, temp_dir):
+        """Test that the user research parser is created once per harvester."""
+        from src.discovery.research import ResearchHarvester
+        
+        harvester = ResearchHarvester(output_dir=temp_dir)
+        harvester.harvest_user_research("First finding from the usability study")
+        parser = harvester._user_parser
+        harvester.harvest_user_research("Second finding from the usability study")
+        
+        assert parser is not None
+        assert harvester._user_parser is parser
+        assert parser.template_manager is harvester.template_manager
+    
+    def test_harvest_user_research_writes_evidence_id(self, temp_dir):
+        """Test that the saved EVD file is headed with the assigned ID."""
+        from src.discovery.research import ResearchHarvester
+        
+        harvester = ResearchHarvester(output_dir=temp_dir)
+        evd_id = harvester.harvest_user_research("# Latency Study\n\nP99 latency doubled under load.")
+        
+        content = (Path(temp_dir) / f"{evd_id}.md").read_text(encoding='utf-8')
+        assert content.startswith(f"# {evd_id} — Latency Study\n")
+        assert 'EVD-####' not in content
+    
+    def test_parse_uses_given_timestamp(self, parser):
+        """Test that an explicit timestamp sets the parse date."""
+        from datetime import datetime
+        
+        parsed = parser.parse_user_research("Some research notes", now=datetime(2024, 3, 5))
+        assert parsed['parsed_date'] == '2024-03-05'
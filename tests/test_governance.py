@@ -1,5 +1,7 @@
 """Tests for the Governance & Autonomy module."""
 import pytest
+import json
+from datetime import datetime
 from src.governance.manager import (
     GovernanceManager, TrustLevel, ChecklistEnforcer, ChecklistStatus
 )
@@ -41,11 +43,59 @@ class TestChecklistEnforcer:
         result = enforcer.validate_phase('decision', artifacts)
         assert result is True
     
+    def test_validate_phase_implementation_requires_passing_tests(self, enforcer):
+        """Test that implementation validation checks each required item."""
+        artifacts = {'test_files': ['tests/test_app.py'], 'tests_passing': False}
+        assert enforcer.validate_phase('implementation', artifacts) is False
+        
+        artifacts['tests_passing'] = True
+        assert enforcer.validate_phase('implementation', artifacts) is True
+    
+    def test_validate_phase_fail_fast_stops_at_first_failure(self, enforcer):
+        """Test that fail_fast skips the remaining item checks."""
+        class RecordingArtifacts(dict):
+            def __init__(self):
+                super().__init__()
+                self.lookups = []
+            
+            def get(self, key, default=None):
+                self.lookups.append(key)
+                return super().get(key, default)
+        
+        artifacts = RecordingArtifacts()
+        assert enforcer.validate_phase('decision', artifacts) is False
+        assert artifacts.lookups == ['evidence_refs']
+        
+        artifacts = RecordingArtifacts()
+        assert enforcer.validate_phase('decision', artifacts, fail_fast=False) is False
+        assert artifacts.lookups == ['evidence_refs', 'options']
+    
     def test_get_checklist(self, enforcer):
         """Test getting checklist for a phase."""
         checklist = enforcer.get_checklist('research')
         assert len(checklist) > 0
         assert any('Evidence harvested' in item['item'] for item in checklist)
+    
+    def test_checklists_shared_and_read_only(self, enforcer):
+        """Test that checklist data is shared across instances and immutable."""
+        assert enforcer.checklists is ChecklistEnforcer().checklists
+        with pytest.raises(TypeError):
+            enforcer.checklists['research'] = ()
+    
+    def test_checklists_can_be_replaced_per_instance(self, enforcer):
+        """Test that an instance can be given its own checklists."""
+        from unittest import mock
+        
+        enforcer.checklists = {'review': [{'item': 'Peer review done', 'required': True}]}
+        assert enforcer.get_checklist('review') == [{'item': 'Peer review done', 'required': True}]
+        assert enforcer.validate_phase('review', {}) is True
+        with pytest.raises(ValueError):
+            enforcer.validate_phase('research', {})
+        
+        other = ChecklistEnforcer()
+        with mock.patch.object(other, 'checklists', {'research': (('Tests passing', True),)}):
+            assert other.get_checklist('research') == [{'item': 'Tests passing', 'required': True}]
+        assert other.get_checklist('research')[0]['item'] == 'Evidence harvested'
 
 
 class TestGovernanceManager:
@@ -198,6 +248,127 @@ class TestGovernanceManager:
         # Test limit
         limited = manager_standard.get_approval_history(limit=1)
         assert len(limited) == 1
+        assert limited[0]['action'] == "Action 2"
+        
+        # History is a list of plain dicts, independent of the log
+        assert type(history) is list
+        assert all(type(record) is dict for record in history)
+        assert [record['action'] for record in history] == ["Action 1", "Action 2"]
+        history.append({'action': 'local'})
+        assert len(manager_standard.get_approval_history()) == 2
+    
+    def test_trust_level_assignment_updates_authorization(self, manager_standard):
+        """Test that assigning trust_level directly takes effect."""
+        assert manager_standard._check_trust_authorization('streamlined') is False
+        
+        manager_standard.trust_level = TrustLevel.GUIDED
+        assert manager_standard._check_trust_authorization('streamlined') is True
+        assert manager_standard.get_governance_status()['trust_level'] == 'GUIDED'
+    
+    def test_request_approval_returns_dict(self, manager_yolo):
+        """Test that request_approval returns a plain dictionary."""
+        result = manager_yolo.request_approval(
+            "Create file", "research", {'evidence_ids': ['EVD-0001']}
+        )
+        
+        assert type(result) is dict
+        assert list(result) == [
+            'timestamp', 'action', 'phase', 'approved', 'mode', 'reason',
+            'risk_level', 'trust_level', 'checklist_passed', 'yolo_mode'
+        ]
+        assert 'approved' in result
+        assert json.loads(json.dumps(result)) == result
+    
+    def test_approval_log_records_are_mappings(self, manager_yolo):
+        """Test that logged records read like the dictionaries they replace."""
+        result = manager_yolo.request_approval(
+            "Create file", "research", {'evidence_ids': ['EVD-0001']}
+        )
+        record = manager_yolo.approval_log[-1]
+        
+        assert record.approved is True
+        assert record['phase'] == 'research'
+        assert 'approved' in record
+        assert 'ts_ns' not in record
+        assert dict(record) == record.to_dict() == result
+        assert record == result
+        assert len(record) == len(result)
+        assert record.get('unknown', 'n/a') == 'n/a'
+        with pytest.raises(KeyError):
+            record['unknown']
+        
+        # Timestamps are stored as nanoseconds and formatted on read
+        logged_at = datetime.fromisoformat(record['timestamp'])
+        assert int(logged_at.timestamp()) == record.ts_ns // 1_000_000_000
+    
+    def test_approval_history_returns_independent_copies(self, manager_yolo):
+        """Test that history dicts are built once but handed out as copies."""
+        manager_yolo.request_approval("Create file", "research", {'evidence_ids': ['EVD-0001']})
+        
+        first = manager_yolo.get_approval_history()
+        first[0]['approved'] = False
+        second = manager_yolo.get_approval_history()
+        
+        assert second[0]['approved'] is True
+        assert second[0] is not first[0]
+        assert manager_yolo.approval_log[0]._as_dict() is manager_yolo.approval_log[0]._as_dict()
+    
+    def test_audit_log_written_in_batches(self, tmp_path):
+        """Test that log records are appended to the audit file per batch."""
+        import json
+        
+        audit_file = tmp_path / "approvals.jsonl"
+        manager = GovernanceManager(audit_log_path=str(audit_file), audit_batch_size=2)
+        artifacts = {'evidence_ids': ['EVD-0001']}
+        
+        manager.request_approval("Action 1", "research", artifacts)
+        assert not audit_file.exists()
+        
+        manager.request_approval("Action 2", "research", artifacts)
+        manager.set_yolo_mode(True)
+        assert len(audit_file.read_text().splitlines()) == 2
+        
+        manager.close()
+        records = [json.loads(line) for line in audit_file.read_text().splitlines()]
+        assert [r['action'] for r in records] == ['Action 1', 'Action 2', 'yolo_mode_change']
+    
+    def test_audit_log_keeps_batch_when_write_fails(self, tmp_path):
+        """Test that records are only dropped from the buffer once written."""
+        audit_file = tmp_path / "logs" / "approvals.jsonl"
+        manager = GovernanceManager(audit_log_path=str(audit_file), audit_batch_size=10)
+        manager.request_approval("Action 1", "research", {'evidence_ids': ['EVD-0001']})
+        
+        with pytest.raises(OSError):
+            manager.flush_audit_log()
+        
+        audit_file.parent.mkdir()
+        manager.flush_audit_log()
+        assert len(audit_file.read_text().splitlines()) == 1
+    
+    def test_audit_log_flushed_when_manager_discarded(self, tmp_path):
+        """Test that pending records are written without an explicit close()."""
+        import gc
+        
+        audit_file = tmp_path / "approvals.jsonl"
+        manager = GovernanceManager(audit_log_path=str(audit_file), audit_batch_size=10)
+        manager.request_approval("Action 1", "research", {'evidence_ids': ['EVD-0001']})
+        assert not audit_file.exists()
+        
+        del manager
+        gc.collect()
+        assert len(audit_file.read_text().splitlines()) == 1
+    
+    def test_approval_log_is_bounded(self):
+        """Test that the oldest records are dropped once the log is full."""
+        manager = GovernanceManager(max_log_size=2)
+        artifacts = {'evidence_ids': ['EVD-0001']}
+        
+        for i in range(3):
+            manager.request_approval(f"Action {i}", "research", artifacts)
+        
+        history = manager.get_approval_history()
+        assert [r['action'] for r in history] == ['Action 1', 'Action 2']
+        assert manager.get_approval_history(limit=1)[0]['action'] == 'Action 2'
 
 
 class TestRiskClassifierThreePathways:
@@ -215,6 +215,14 @@ class TestSystemGuard:
         assert len(log) > 0
         assert any(entry['operation'] == 'create' for entry in log)
     
+    def test_classify_artifact(self, guard):
+        """Test identifying artifact kinds from file names."""
+        assert guard.classify_artifact("research/evidence/EVD-0001.md") == 'evidence'
+        assert guard.classify_artifact("specs/SPEC-0002-auth.md") == 'spec'
+        assert guard.classify_artifact("decisions/DEC-0003.md") == 'decision'
+        assert guard.classify_artifact("tests/TEST-0004.md") == 'test'
+        assert guard.classify_artifact("src/app.py") is None
+    
     def test_set_strict_mode(self, guard):
         """Test toggling strict mode."""
         assert guard.strict_mode is True
@@ -57,6 +57,19 @@ class TestPromptOptimizer:
         for evd_id in result['evidence_ids']:
             assert evd_id.startswith("EVD-")
     
+    def test_process_user_input_multiple_topics_ordered_ids(self, optimizer):
+        """Test that evidence IDs are assigned in topic order."""
+        result = optimizer.process_user_input(
+            "Improve security, testing and deployment of the service"
+        )
+        
+        topics = result['research_topics']
+        assert topics == ['security', 'testing', 'deployment']
+        assert result['evidence_ids'] == ['EVD-0001', 'EVD-0002', 'EVD-0003']
+        
+        for topic, evd_id in zip(topics, result['evidence_ids']):
+            assert optimizer.research_harvester.get_evidence(evd_id)['topic'] == topic
+    
     def test_process_user_input_updates_workflow_state(self, optimizer):
         """Test that workflow state is updated."""
         user_input = "Add logging to the application"
@@ -89,6 +102,50 @@ class TestPromptOptimizer:
         assert summary['decisions_count'] == 1
         assert dec_id in summary['decision_ids']
     
+    def test_create_decisions_numbered_sequentially(self, optimizer):
+        """Test that successive decisions and specs get consecutive IDs."""
+        evd_ids = optimizer.process_user_input("Test authentication methods")['evidence_ids']
+        
+        dec_ids = [
+            optimizer.create_decision_with_evidence(
+                decision_title=f"Decision {i}",
+                evidence_refs=evd_ids,
+                options=["A", "B"],
+                chosen_option="A",
+                rationale="Simplest"
+            )
+            for i in range(2)
+        ]
+        spec_id = optimizer.create_spec_with_traceability(
+            spec_title="Spec",
+            evidence_refs=evd_ids,
+            decision_refs=dec_ids,
+            requirements=["REQ-0001"]
+        )
+        
+        assert dec_ids == ["DEC-0001", "DEC-0002"]
+        assert spec_id == "SPEC-0001"
+    
+    def test_create_decision_continues_from_existing_state(self, optimizer):
+        """Test that IDs continue after decisions already in the workflow state."""
+        evd_ids = optimizer.process_user_input("Test authentication methods")['evidence_ids']
+        
+        def create():
+            return optimizer.create_decision_with_evidence(
+                decision_title="Decision",
+                evidence_refs=evd_ids,
+                options=["A", "B"],
+                chosen_option="A",
+                rationale="Simplest"
+            )
+        
+        optimizer.workflow_state['decisions'].append({'id': 'DEC-0007'})
+        assert create() == "DEC-0008"
+        
+        optimizer.workflow_state['decisions'] = [{'id': 'DEC-0003'}, {'id': 'DEC-0009'}]
+        assert create() == "DEC-0010"
+        assert create() == "DEC-0011"
+    
     def test_create_decision_without_evidence_raises_error(self, optimizer):
         """Test that creating a decision without evidence raises error."""
         with pytest.raises(ValueError, match="Cannot create DEC without evidence references"):